@@ -6,6 +6,23 @@
 BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE  # Compressed data read chunk size
 
 
+def _check_workers(workers):
+    """Check a workers argument, and return whether it asks for a thread
+    pool."""
+    if workers is None:
+        return False
+    if workers < 1:
+        raise ValueError("workers must be None or >= 1")
+    return workers > 1
+
+
+def _thread_pool(workers):
+    """Return a thread pool with the given number of workers."""
+    # Imported lazily, since most programs never use several workers.
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(workers)
+
+
 class BaseStream(io.BufferedIOBase):
     """Mode-checking helper functions."""
 
@@ -65,9 +82,49 @@ def seekable(self):
 
     def readinto(self, b):
         with memoryview(b) as view, view.cast("B") as byte_view:
-            data = self.read(len(byte_view))
-            byte_view[:len(data)] = data
-        return len(data)
+            if not hasattr(self._decompressor, "decompress_into"):
+                data = self.read(len(byte_view))
+                byte_view[:len(data)] = data
+                return len(data)
+            return self._readinto(byte_view)
+
+    def _readinto(self, byte_view):
+        # Like read(), but the decompressor writes directly into byte_view.
+        if not byte_view or self._eof:
+            return 0
+        n = 0  # Default if EOF is encountered
+        while True:
+            if self._decompressor.eof:
+                rawblock = (self._decompressor.unused_data or
+                            self._fp.read(BUFFER_SIZE))
+                if not rawblock:
+                    break
+                # Continue to next stream.
+                self._decompressor = self._decomp_factory(
+                    **self._decomp_args)
+                try:
+                    n = self._decompressor.decompress_into(rawblock,
+                                                           byte_view)
+                except self._trailing_error:
+                    # Trailing data isn't a valid compressed stream; ignore it.
+                    break
+            else:
+                if self._decompressor.needs_input:
+                    rawblock = self._fp.read(BUFFER_SIZE)
+                    if not rawblock:
+                        raise EOFError("Compressed file ended before the "
+                                       "end-of-stream marker was reached")
+                else:
+                    rawblock = b""
+                n = self._decompressor.decompress_into(rawblock, byte_view)
+            if n:
+                break
+        if not n:
+            self._eof = True
+            self._size = self._pos
+            return 0
+        self._pos += n
+        return n
 
     def read(self, size=-1):
         if size < 0:
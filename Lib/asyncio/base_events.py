@@ -67,6 +67,12 @@
 MAXIMUM_SELECT_TIMEOUT = 24 * 3600
 
 
+# Snapshot of the statistics collected for a task when task profiling is
+# enabled, see BaseEventLoop.set_task_profiling().
+TaskProfile = collections.namedtuple('TaskProfile',
+                                     ['steps', 'run_time', 'wait_time'])
+
+
 def _format_handle(handle):
     cb = handle._callback
     if isinstance(getattr(cb, '__self__', None), tasks.Task):
@@ -404,6 +410,7 @@ def __init__(self):
         # exceed this duration in seconds, the slow callback/task is logged.
         self.slow_callback_duration = 0.1
         self._current_handle = None
+        self._task_profiles = None
         self._task_factory = None
         self._coroutine_origin_tracking_enabled = False
         self._coroutine_origin_tracking_saved_depth = None
@@ -792,6 +799,8 @@ def _call_soon(self, callback, args, context):
         handle = events.Handle(callback, args, self, context)
         if handle._source_traceback:
             del handle._source_traceback[-1]
+        if self._task_profiles is not None:
+            handle._ready_time = self.time()
         self._ready.append(handle)
         return handle
 
@@ -1859,6 +1868,8 @@ def call_exception_handler(self, context):
     def _add_callback(self, handle):
         """Add a Handle to _ready."""
         if not handle._cancelled:
+            if self._task_profiles is not None:
+                handle._ready_time = self.time()
             self._ready.append(handle)
 
     def _add_callback_signalsafe(self, handle):
@@ -1869,7 +1880,16 @@ def _add_callback_signalsafe(self, handle):
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            scheduled = self._scheduled
+            if scheduled and scheduled[-1] is handle:
+                # Removing the last item keeps the heap invariant.  This is
+                # the common case for timeouts (asyncio.timeout(),
+                # wait_for()) that are cancelled shortly after being
+                # scheduled, so they don't linger until the next cleanup.
+                scheduled.pop()
+                handle._scheduled = False
+            else:
+                self._timer_cancelled_count += 1
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1923,6 +1943,8 @@ def _run_once(self):
                 break
             handle = heapq.heappop(self._scheduled)
             handle._scheduled = False
+            if self._task_profiles is not None:
+                handle._ready_time = handle._when
             self._ready.append(handle)
 
         # This is the only place where callbacks are actually *called*.
@@ -1932,25 +1954,45 @@ def _run_once(self):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is thread-safe without using locks.
         ntodo = len(self._ready)
+        task_profiles = self._task_profiles
         for i in range(ntodo):
             handle = self._ready.popleft()
             if handle._cancelled:
                 continue
-            if self._debug:
+            if self._debug or task_profiles is not None:
                 try:
                     self._current_handle = handle
                     t0 = self.time()
                     handle._run()
                     dt = self.time() - t0
-                    if dt >= self.slow_callback_duration:
+                    if self._debug and dt >= self.slow_callback_duration:
                         logger.warning('Executing %s took %.3f seconds',
                                        _format_handle(handle), dt)
+                    if task_profiles is not None:
+                        self._update_task_profile(handle, t0, dt)
                 finally:
                     self._current_handle = None
             else:
                 handle._run()
         handle = None  # Needed to break cycles when an exception occurs.
 
+    def _update_task_profile(self, handle, start_time, run_time):
+        task = getattr(handle._callback, '__self__', None)
+        if not isinstance(task, (tasks.Task, tasks._PyTask)):
+            return
+        # Handles made ready before profiling was enabled have no time.
+        if handle._ready_time is None:
+            wait_time = 0.0
+        else:
+            wait_time = max(0.0, start_time - handle._ready_time)
+        profile = self._task_profiles.get(task)
+        if profile is None:
+            self._task_profiles[task] = [1, run_time, wait_time]
+        else:
+            profile[0] += 1
+            profile[1] += run_time
+            profile[2] += wait_time
+
     def _set_coroutine_origin_tracking(self, enabled):
         if bool(enabled) == bool(self._coroutine_origin_tracking_enabled):
             return
@@ -1966,6 +2008,23 @@ def _set_coroutine_origin_tracking(self, enabled):
 
         self._coroutine_origin_tracking_enabled = enabled
 
+    def get_task_profiling(self):
+        return self._task_profiles is not None
+
+    def set_task_profiling(self, enabled):
+        if not enabled:
+            self._task_profiles = None
+        elif self._task_profiles is None:
+            self._task_profiles = weakref.WeakKeyDictionary()
+
+    def get_task_profile(self, task):
+        if self._task_profiles is None:
+            return None
+        profile = self._task_profiles.get(task)
+        if profile is None:
+            return None
+        return TaskProfile(*profile)
+
     def get_debug(self):
         return self._debug
 
@@ -27,7 +27,7 @@ class Handle:
 
     __slots__ = ('_callback', '_args', '_cancelled', '_loop',
                  '_source_traceback', '_repr', '__weakref__',
-                 '_context')
+                 '_context', '_ready_time')
 
     def __init__(self, callback, args, loop, context=None):
         if context is None:
@@ -38,6 +38,7 @@ def __init__(self, callback, args, loop, context=None):
         self._args = args
         self._cancelled = False
         self._repr = None
+        self._ready_time = None
         if self._loop.get_debug():
             self._source_traceback = format_helpers.extract_stack(
                 sys._getframe(1))
@@ -602,6 +603,17 @@ def default_exception_handler(self, context):
     def call_exception_handler(self, context):
         raise NotImplementedError
 
+    # Task profiling.
+
+    def get_task_profiling(self):
+        raise NotImplementedError
+
+    def set_task_profiling(self, enabled):
+        raise NotImplementedError
+
+    def get_task_profile(self, task):
+        raise NotImplementedError
+
     # Debug flag management.
 
     def get_debug(self):
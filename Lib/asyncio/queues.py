@@ -40,6 +40,10 @@ def __init__(self, maxsize=0):
         self._unfinished_tasks = 0
         self._finished = locks.Event()
         self._finished.set()
+        # Statistics.
+        self._high_water_mark = 0
+        self._put_waits = 0
+        self._get_waits = 0
         self._init(maxsize)
 
     # These three are overridable in subclasses.
@@ -92,6 +96,21 @@ def maxsize(self):
         """Number of items allowed in the queue."""
         return self._maxsize
 
+    @property
+    def high_water_mark(self):
+        """Largest number of items that have been in the queue at once."""
+        return self._high_water_mark
+
+    @property
+    def put_waits(self):
+        """Number of times put() had to wait for a free slot."""
+        return self._put_waits
+
+    @property
+    def get_waits(self):
+        """Number of times get() had to wait for an item."""
+        return self._get_waits
+
     def empty(self):
         """Return True if the queue is empty, False otherwise."""
         return not self._queue
@@ -116,6 +135,7 @@ async def put(self, item):
         while self.full():
             putter = self._get_loop().create_future()
             self._putters.append(putter)
+            self._put_waits += 1
             try:
                 await putter
             except:
@@ -142,10 +162,25 @@ def put_nowait(self, item):
         if self.full():
             raise QueueFull
         self._put(item)
+        size = self.qsize()
+        if size > self._high_water_mark:
+            self._high_water_mark = size
         self._unfinished_tasks += 1
         self._finished.clear()
         self._wakeup_next(self._getters)
 
+    async def put_many(self, items):
+        """Put all items from an iterable into the queue.
+
+        Items are added in iteration order.  Whenever the queue is full,
+        wait until a free slot is available before adding the next item.
+        """
+        for item in items:
+            if self.full():
+                await self.put(item)
+            else:
+                self.put_nowait(item)
+
     async def get(self):
         """Remove and return an item from the queue.
 
@@ -154,6 +189,7 @@ async def get(self):
         while self.empty():
             getter = self._get_loop().create_future()
             self._getters.append(getter)
+            self._get_waits += 1
             try:
                 await getter
             except:
@@ -183,6 +219,48 @@ def get_nowait(self):
         self._wakeup_next(self._putters)
         return item
 
+    async def get_many(self, max_items=None):
+        """Remove and return a list of items from the queue.
+
+        If queue is empty, wait until an item is available.  Then return
+        all immediately available items, but no more than max_items if it
+        is not None.
+        """
+        self._check_max_items(max_items)
+        if self.empty():
+            # get() waits for the first item and deals with cancellation.
+            items = [await self.get()]
+            if max_items is not None:
+                max_items -= 1
+            items.extend(self._get_many(max_items))
+            return items
+        return self._get_many(max_items)
+
+    def get_many_nowait(self, max_items=None):
+        """Remove and return a list of items from the queue.
+
+        Return all immediately available items, but no more than max_items
+        if it is not None.  If no item is available, raise QueueEmpty.
+        """
+        self._check_max_items(max_items)
+        if self.empty():
+            raise QueueEmpty
+        return self._get_many(max_items)
+
+    def _check_max_items(self, max_items):
+        if max_items is not None and max_items <= 0:
+            raise ValueError("'max_items' must be None or a positive number")
+
+    def _get_many(self, max_items):
+        if max_items is None:
+            max_items = self.qsize()
+        items = []
+        while max_items > 0 and not self.empty():
+            items.append(self._get())
+            self._wakeup_next(self._putters)
+            max_items -= 1
+        return items
+
     def task_done(self):
         """Indicate that a formerly enqueued task is complete.
 
@@ -708,20 +708,32 @@ async def sock_accept(self, sock):
         base_events._check_ssl_socket(sock)
         if self._debug and sock.gettimeout() != 0:
             raise ValueError("the socket must be non-blocking")
+        try:
+            conn, address = sock.accept()
+        except (BlockingIOError, InterruptedError):
+            pass
+        else:
+            conn.setblocking(False)
+            return conn, address
         fut = self.create_future()
-        self._sock_accept(fut, sock)
+        fd = sock.fileno()
+        self._ensure_fd_no_transport(fd)
+        handle = self._add_reader(fd, self._sock_accept, fut, sock)
+        fut.add_done_callback(
+            functools.partial(self._sock_read_done, fd, handle=handle))
         return await fut
 
     def _sock_accept(self, fut, sock):
-        fd = sock.fileno()
+        # _sock_accept() can add itself as an I/O callback if the operation
+        # can't be done immediately. Don't use it directly, call
+        # sock_accept().
+        if fut.done():
+            return
         try:
             conn, address = sock.accept()
             conn.setblocking(False)
         except (BlockingIOError, InterruptedError):
-            self._ensure_fd_no_transport(fd)
-            handle = self._add_reader(fd, self._sock_accept, fut, sock)
-            fut.add_done_callback(
-                functools.partial(self._sock_read_done, fd, handle=handle))
+            return  # try again next time
         except (SystemExit, KeyboardInterrupt):
             raise
         except BaseException as exc:
@@ -1172,13 +1184,26 @@ def writelines(self, list_of_data):
             raise RuntimeError('Cannot call writelines() after write_eof()')
         if self._empty_waiter is not None:
             raise RuntimeError('unable to writelines; sendfile is in progress')
-        if not list_of_data:
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
             return
-        self._buffer.extend([memoryview(data) for data in list_of_data])
-        self._write_ready()
-        # If the entire buffer couldn't be written, register a write handler
-        if self._buffer:
+
+        was_empty = not self._buffer
+        # Empty chunks are dropped: sendmsg() could never consume them.
+        self._buffer.extend([memoryview(data) for data in list_of_data if data])
+        if not self._buffer:
+            return
+        if was_empty:
+            # Optimization: try to send now.  If a write handler is already
+            # registered, the socket is known to be full, so don't bother.
+            self._write_ready()
+            # If the entire buffer couldn't be written, register a write handler
+            if not self._buffer:
+                return
             self._loop._add_writer(self._sock_fd, self._write_ready)
+        self._maybe_pause_protocol()
 
     def can_write_eof(self):
         return True
@@ -842,6 +842,18 @@ def _done_callback(fut):
         children.append(fut)
 
     outer = _GatheringFuture(children, loop=loop)
+    if len(done_futs) == nfuts:
+        # optimization: all futures finished eagerly (e.g. with an eager
+        # task factory); if they all succeeded, set the result right away
+        # instead of going through _done_callback() for each of them
+        results = []
+        for fut in children:
+            if fut.cancelled() or fut.exception() is not None:
+                break
+            results.append(fut.result())
+        else:
+            outer.set_result(results)
+            return outer
     # Run done callbacks after GatheringFuture created so any post-processing
     # can be performed at this point
     # optimization: in the special case that *all* futures finished eagerly,
@@ -183,6 +183,15 @@ def readinto(self, b):
         self._check_can_read()
         return self._buffer.readinto(b)
 
+    def readinto1(self, b):
+        """Read bytes into b, while trying to avoid making multiple reads
+        from the underlying stream.
+
+        Returns the number of bytes read (0 for EOF).
+        """
+        self._check_can_read()
+        return self._buffer.readinto1(b)
+
     def readline(self, size=-1):
         """Read a line of uncompressed bytes from the file.
 
@@ -310,14 +319,31 @@ def open(filename, mode="rb", compresslevel=9,
         return binary_file
 
 
-def compress(data, compresslevel=9):
+def compress(data, compresslevel=9, *, workers=None):
     """Compress a block of data.
 
     compresslevel, if given, must be a number between 1 and 9.
 
+    workers, if given and greater than 1, is the number of threads used to
+    compress large data.  The data is then split in pieces of the bzip2 block
+    size, which are compressed to concatenated bzip2 streams.
+
     For incremental compression, use a BZ2Compressor object instead.
     """
+    # Creating the compressor also checks compresslevel.
     comp = BZ2Compressor(compresslevel)
+    block_size = compresslevel * 100_000
+    if (_compression._check_workers(workers) and
+            memoryview(data).nbytes > block_size):
+        data = memoryview(data).cast('B')
+
+        def compress_block(start):
+            comp = BZ2Compressor(compresslevel)
+            return comp.compress(data[start:start + block_size]) + comp.flush()
+
+        with _compression._thread_pool(workers) as executor:
+            return b"".join(executor.map(compress_block,
+                                         range(0, len(data), block_size)))
     return comp.compress(data) + comp.flush()
 
 
@@ -182,16 +182,16 @@ def submit(self, fn, /, *args, **kwargs):
 
     def _adjust_thread_count(self):
         # if idle threads are available, don't spin new threads
-        if self._idle_semaphore.acquire(timeout=0):
+        if self._idle_semaphore.acquire(blocking=False):
             return
 
-        # When the executor gets lost, the weakref callback will wake up
-        # the worker threads.
-        def weakref_cb(_, q=self._work_queue):
-            q.put(None)
-
         num_threads = len(self._threads)
         if num_threads < self._max_workers:
+            # When the executor gets lost, the weakref callback will wake up
+            # the worker threads.
+            def weakref_cb(_, q=self._work_queue):
+                q.put(None)
+
             thread_name = '%s_%d' % (self._thread_name_prefix or self,
                                      num_threads)
             t = threading.Thread(name=thread_name, target=_worker,
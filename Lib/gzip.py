@@ -23,6 +23,10 @@
 
 READ_BUFFER_SIZE = 128 * 1024
 _WRITE_BUFFER_SIZE = 4 * io.DEFAULT_BUFFER_SIZE
+# Amount of input compressed by each worker in compress(workers=...), and the
+# size of the deflate window primed from the preceding input.
+_PARALLEL_BLOCK_SIZE = 128 * 1024
+_DEFLATE_WINDOW_SIZE = 32 * 1024
 
 
 def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
@@ -336,6 +340,20 @@ def read1(self, size=-1):
             size = io.DEFAULT_BUFFER_SIZE
         return self._buffer.read1(size)
 
+    def readinto(self, b):
+        self._check_not_closed()
+        if self.mode != READ:
+            import errno
+            raise OSError(errno.EBADF, "readinto() on write-only GzipFile object")
+        return self._buffer.readinto(b)
+
+    def readinto1(self, b):
+        self._check_not_closed()
+        if self.mode != READ:
+            import errno
+            raise OSError(errno.EBADF, "readinto1() on write-only GzipFile object")
+        return self._buffer.readinto1(b)
+
     def peek(self, n):
         self._check_not_closed()
         if self.mode != READ:
@@ -548,6 +566,46 @@ def read(self, size=-1):
         self._pos += len(uncompress)
         return uncompress
 
+    def _readinto(self, byte_view):
+        # Like read(), but the decompressor writes directly into byte_view.
+        if not byte_view:
+            return 0
+
+        while True:
+            if self._decompressor.eof:
+                self._read_eof()
+                self._new_member = True
+                self._decompressor = self._decomp_factory(
+                    **self._decomp_args)
+
+            if self._new_member:
+                self._init_read()
+                if not self._read_gzip_header():
+                    self._size = self._pos
+                    return 0
+                self._new_member = False
+
+            if self._decompressor.needs_input:
+                buf = self._fp.read(READ_BUFFER_SIZE)
+                n = self._decompressor.decompress_into(buf, byte_view)
+            else:
+                n = self._decompressor.decompress_into(b"", byte_view)
+
+            if self._decompressor.unused_data != b"":
+                self._fp.prepend(self._decompressor.unused_data)
+
+            if n:
+                break
+            if buf == b"":
+                raise EOFError("Compressed file ended before the "
+                               "end-of-stream marker was reached")
+
+        with byte_view[:n] as data:
+            self._crc = zlib.crc32(data, self._crc)
+        self._stream_size += n
+        self._pos += n
+        return n
+
     def _read_eof(self):
         # We've read to the end of the file
         # We check that the computed CRC and size of the
@@ -595,13 +653,52 @@ def _create_simple_gzip_header(compresslevel: int,
     return struct.pack("<BBBBLBB", 0x1f, 0x8b, 8, 0, int(mtime), xfl, 255)
 
 
-def compress(data, compresslevel=_COMPRESS_LEVEL_BEST, *, mtime=None):
+def _compress_blocks(data, compresslevel, workers):
+    """Deflate data in independent blocks on a thread pool.
+
+    Each block is primed with the last 32 KiB of input preceding it and all
+    but the last end with a sync flush, so the concatenated blocks form a
+    single raw deflate stream.
+    """
+    data = memoryview(data).cast('B')
+
+    def compress_block(start):
+        end = start + _PARALLEL_BLOCK_SIZE
+        if start:
+            zdict = data[max(start - _DEFLATE_WINDOW_SIZE, 0):start]
+            compressor = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                          -zlib.MAX_WBITS, zdict=zdict)
+        else:
+            compressor = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                          -zlib.MAX_WBITS)
+        mode = zlib.Z_FINISH if end >= len(data) else zlib.Z_SYNC_FLUSH
+        return compressor.compress(data[start:end]) + compressor.flush(mode)
+
+    with _compression._thread_pool(workers) as executor:
+        blocks = executor.map(compress_block,
+                              range(0, len(data), _PARALLEL_BLOCK_SIZE))
+        # The checksum is computed while the workers are compressing.
+        crc = zlib.crc32(data)
+        return b"".join(blocks), crc, len(data)
+
+
+def compress(data, compresslevel=_COMPRESS_LEVEL_BEST, *, mtime=None,
+             workers=None):
     """Compress data in one shot and return the compressed string.
 
     compresslevel sets the compression level in range of 0-9.
     mtime can be used to set the modification time. The modification time is
     set to the current time by default.
+    workers, if given and greater than 1, is the number of threads used to
+    compress large data.  The result is a single gzip member as usual, but
+    may be slightly larger.
     """
+    if (_compression._check_workers(workers) and
+            memoryview(data).nbytes > _PARALLEL_BLOCK_SIZE):
+        body, crc, size = _compress_blocks(data, compresslevel, workers)
+        header = _create_simple_gzip_header(compresslevel, mtime)
+        trailer = struct.pack("<LL", crc, size & 0xffffffff)
+        return header + body + trailer
     if mtime == 0:
         # Use zlib as it creates the header with 0 mtime by default.
         # This is faster and with less overhead.
@@ -97,13 +97,13 @@
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads', 'AttrDict',
-    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
+    'dump', 'dumps', 'load', 'loads', 'iterload', 'AttrDict',
+    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder', 'JSONStreamDecoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, JSONStreamDecoder
 from .encoder import JSONEncoder
 import codecs
 
@@ -358,6 +358,69 @@ def loads(s, *, cls=None, object_hook=None, parse_float=None,
         kw['parse_constant'] = parse_constant
     return cls(**kw).decode(s)
 
+# Size of the pieces in which iterload() reads the file.
+_ITERLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def iterload(fp, *, array=False, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
+    """Incrementally deserialize ``fp`` (a ``.read()``-supporting file-like
+    object containing a sequence of JSON documents separated by whitespace,
+    such as JSON Lines) and return an iterator over the documents.
+
+    If ``array`` is true, ``fp`` must contain a single JSON array and the
+    iterator yields its items instead.
+
+    ``fp`` is read in chunks, so only the document or array item being
+    decoded has to be held in memory rather than the whole file.
+
+    The other arguments have the same meaning as in ``load()``.
+    """
+    if cls is None:
+        cls = JSONDecoder
+    if object_hook is not None:
+        kw['object_hook'] = object_hook
+    if object_pairs_hook is not None:
+        kw['object_pairs_hook'] = object_pairs_hook
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    return _iterload(fp, JSONStreamDecoder(cls(**kw), array=array))
+
+
+def _iterload(fp, decoder):
+    data = fp.read(_ITERLOAD_CHUNK_SIZE)
+    if isinstance(data, str):
+        if data.startswith('\ufeff'):
+            raise JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)",
+                                  data, 0)
+        textdecoder = None
+    else:
+        if not isinstance(data, (bytes, bytearray)):
+            raise TypeError(f'the JSON object must be str, bytes or bytearray, '
+                            f'not {data.__class__.__name__}')
+        # detect_encoding() looks at the first 4 bytes.
+        while 0 < len(data) < 4:
+            more = fp.read(_ITERLOAD_CHUNK_SIZE)
+            if not more:
+                break
+            data += more
+        textdecoder = codecs.getincrementaldecoder(
+            detect_encoding(data))('surrogatepass')
+    while True:
+        if textdecoder is None:
+            s = data
+        else:
+            s = textdecoder.decode(data, final=not data)
+        yield from decoder.decode(s, final=not data)
+        if not data:
+            break
+        data = fp.read(_ITERLOAD_CHUNK_SIZE)
+
+
 class AttrDict(dict):
     """Dict like object that supports attribute style dotted access.
 
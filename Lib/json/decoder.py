@@ -8,7 +8,7 @@
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'JSONStreamDecoder']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -354,3 +354,221 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+
+_NUMBER_TAIL = re.compile(r'[0-9.eE+-]*', FLAGS)
+_CONSTANT_NAMES = ('true', 'false', 'null', 'NaN', 'Infinity', '-Infinity')
+
+# States of JSONStreamDecoder.  Without array, only _ARRAY_ITEM and
+# _ARRAY_DELIM are used, the latter for a document not yet followed by
+# whitespace.
+_ARRAY_START, _ARRAY_FIRST, _ARRAY_ITEM, _ARRAY_DELIM, _ARRAY_END = range(5)
+
+# Used by JSONStreamDecoder to follow an incomplete value.
+_SCALAR_END = re.compile(r'[^0-9A-Za-z.+-]', FLAGS)
+_NOT_STRUCTURE = bytes(c for c in range(256) if c not in b'[]{}"')
+
+
+def _is_truncated(err):
+    """Return true if the JSONDecodeError err may only be due to the
+    document being cut short, so that more data could make it valid.
+
+    """
+    if err.msg.startswith('Unterminated string'):
+        return True
+    tail = err.doc[err.pos:]
+    if err.msg.startswith('Invalid \\uXXXX escape'):
+        # A cut \uXXXX escape, unless the string was already closed.
+        return '"' not in tail
+    # A cut number or constant, or nothing at all.
+    return (_NUMBER_TAIL.fullmatch(tail) is not None or
+            any(name.startswith(tail) for name in _CONSTANT_NAMES))
+
+
+class JSONStreamDecoder(object):
+    """Incremental JSON decoder for documents that arrive in chunks.
+
+    Text is passed to ``decode()`` in pieces of any size, and each call
+    returns the list of values that have been completed.  By
+    default the text is a sequence of JSON documents separated by
+    whitespace, such as JSON Lines, and the values are the documents.  If
+    ``array`` is true, the text must be a single JSON array and the values
+    are its items, so that a large array never has to be held in memory as
+    a whole.
+
+    A value that is cut short is only decoded again once a piece could
+    complete it, so that a large value is not decoded again for every
+    piece.  The pieces in between are only scanned for brackets and
+    quotes.
+
+    ``decoder`` is the ``JSONDecoder`` used to decode each value; a default
+    ``JSONDecoder()`` is used if it is not given.
+
+    """
+
+    def __init__(self, decoder=None, *, array=False):
+        if decoder is None:
+            decoder = JSONDecoder()
+        self.decoder = decoder
+        self.array = array
+        self._state = _ARRAY_START if array else _ARRAY_ITEM
+        # Text not yet decoded, which starts with a value cut short.
+        self._pending = []
+        # What _scan() knows about the value that was cut short.
+        self._scalar = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def decode(self, s, final=False):
+        """Decode the next piece ``s`` (a ``str`` instance) of the text and
+        return a list of the values completed since the last call.
+
+        If ``final`` is true, ``s`` is the last piece and a
+        ``JSONDecodeError`` is raised if the text ends in an incomplete
+        value.  Invalid data in a value is reported once the value could be
+        complete.  Error positions are relative to the text that was buffered
+        since the last value completed.
+
+        """
+        if not isinstance(s, str):
+            raise TypeError(f'the JSON object must be str, '
+                            f'not {s.__class__.__name__}')
+        if self._pending and not final and not self._scan(s):
+            self._pending.append(s)
+            return []
+        self._pending.append(s)
+        doc = ''.join(self._pending)
+        values = []
+        end = self._decode_values(doc, values, final)
+        rest = doc[end:]
+        self._pending = [rest] if rest else []
+        self._scalar = rest[:1] not in ('[', '{', '"')
+        self._depth = 0
+        self._in_string = self._escape = False
+        self._scan(rest)
+        return values
+
+    def _scan(self, s):
+        """Scan the next piece ``s`` of a value that was cut short and
+        return true if the value may be complete now.
+
+        """
+        if self._scalar:
+            # A number or constant ends at the first other character.
+            return _SCALAR_END.search(s) is not None
+        # A value often ends early in the piece, such as a JSON Lines
+        # record cut short by the previous piece, so the piece is scanned
+        # in growing parts.
+        pos = 0
+        size = 1024
+        while pos < len(s):
+            if self._scan_part(s[pos:pos + size]):
+                return True
+            pos += size
+            size *= 4
+        return False
+
+    def _scan_part(self, s):
+        if self._escape:
+            # Skip the character escaped at the end of the last piece.
+            self._escape = False
+            s = s[1:]
+        escape = (len(s) - len(s.rstrip('\\'))) % 2 == 1
+        # Keep only the brackets and the quotes around strings.  This is
+        # done on UTF-8, where no byte of a multibyte character is ASCII,
+        # because bytes.translate() can delete all the other characters.
+        b = s.encode('utf-8', 'surrogatepass')
+        b = b.replace(b'\\\\', b'').replace(b'\\"', b'')
+        b = b.translate(None, _NOT_STRUCTURE)
+        depth = self._depth
+        if self._in_string:
+            end = b.find(b'"')
+            if end < 0:
+                self._escape = escape
+                return False
+            self._in_string = False
+            if not depth:
+                return True
+            b = b[end + 1:]
+        parts = b.split(b'"')
+        if len(parts) % 2 == 0:
+            # The piece ends in a string.
+            self._in_string = True
+            self._escape = escape
+        b = b''.join(parts[::2])
+        # Cancel out the matching pairs of brackets, leaving the brackets
+        # closed and opened by this piece.
+        while True:
+            reduced = b.replace(b'[]', b'').replace(b'{}', b'')
+            if len(reduced) == len(b):
+                break
+            b = reduced
+        opened = b.lstrip(b']}')
+        closed = len(b) - len(opened)
+        if closed and closed >= depth or b']' in opened or b'}' in opened:
+            # The value ends here, or the brackets do not match.
+            return True
+        self._depth = depth - closed + len(opened)
+        return False
+
+    def _decode_values(self, s, values, final, _w=WHITESPACE.match):
+        raw_decode = self.decoder.raw_decode
+        array = self.array
+        state = self._state
+        end = _w(s, 0).end()
+        if end and not array:
+            state = _ARRAY_ITEM
+        try:
+            while end != len(s):
+                if array:
+                    nextchar = s[end]
+                    if state == _ARRAY_START:
+                        if nextchar != '[':
+                            raise JSONDecodeError("Expecting '['", s, end)
+                        state = _ARRAY_FIRST
+                        end = _w(s, end + 1).end()
+                        continue
+                    if nextchar == ']' and state != _ARRAY_ITEM:
+                        if state == _ARRAY_END:
+                            raise JSONDecodeError("Extra data", s, end)
+                        state = _ARRAY_END
+                        end = _w(s, end + 1).end()
+                        continue
+                    if state == _ARRAY_DELIM:
+                        if nextchar != ',':
+                            raise JSONDecodeError("Expecting ',' delimiter",
+                                                  s, end)
+                        state = _ARRAY_ITEM
+                        end = _w(s, end + 1).end()
+                        continue
+                    if state == _ARRAY_END:
+                        raise JSONDecodeError("Extra data", s, end)
+                elif state == _ARRAY_DELIM:
+                    raise JSONDecodeError("Extra data", s, end)
+                try:
+                    obj, value_end = raw_decode(s, end)
+                except JSONDecodeError as err:
+                    if final or not _is_truncated(err):
+                        raise
+                    break
+                if (not final and s[end] not in '[{"' and
+                        _NUMBER_TAIL.fullmatch(s, value_end)):
+                    # A number or constant at the end of the text may
+                    # continue in the next piece.
+                    break
+                values.append(obj)
+                end = _w(s, value_end).end()
+                if array or end == value_end:
+                    state = _ARRAY_DELIM
+                else:
+                    state = _ARRAY_ITEM
+            else:
+                if final and array and state != _ARRAY_END:
+                    if state == _ARRAY_DELIM:
+                        raise JSONDecodeError("Expecting ',' delimiter",
+                                              s, end)
+                    raise JSONDecodeError("Expecting value", s, end)
+        finally:
+            self._state = state
+        return end
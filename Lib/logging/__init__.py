@@ -1030,6 +1030,49 @@ def handle(self, record):
                 self.release()
         return rv
 
+    def emit_batch(self, records):
+        """
+        Emit a list of records.
+
+        This is called by handle_batch() with the I/O thread lock held. The
+        base implementation just calls emit() for each record; subclasses may
+        override it to output several records at once.
+        """
+        for record in records:
+            self.emit(record)
+
+    def handle_batch(self, records):
+        """
+        Conditionally emit a list of logging records.
+
+        Records which do not pass the filters which may have been added to the
+        handler are dropped, and the others are passed to emit_batch() with a
+        single acquisition of the I/O thread lock. If a subclass overrides
+        handle(), each record is passed to handle() instead.
+
+        Returns the list of records which were emitted.
+        """
+        batch = []
+        if type(self).handle is not Handler.handle:
+            for record in records:
+                rv = self.handle(record)
+                if rv:
+                    batch.append(rv if isinstance(rv, LogRecord) else record)
+            return batch
+        for record in records:
+            rv = self.filter(record)
+            if isinstance(rv, LogRecord):
+                record = rv
+            if rv:
+                batch.append(record)
+        if batch:
+            self.acquire()
+            try:
+                self.emit_batch(batch)
+            finally:
+                self.release()
+        return batch
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -1167,6 +1210,37 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def emit_batch(self, records):
+        """
+        Emit a list of records.
+
+        The formatted records are written to the stream with a single call to
+        write() and the stream is flushed once. If a subclass overrides emit(),
+        the records are passed to it one by one instead.
+        """
+        if type(self).emit is not StreamHandler.emit:
+            Handler.emit_batch(self, records)
+        else:
+            self._write_batch(records)
+
+    def _write_batch(self, records):
+        msgs = []
+        for record in records:
+            try:
+                msgs.append(self.format(record) + self.terminator)
+            except RecursionError:  # See issue 36272
+                raise
+            except Exception:
+                self.handleError(record)
+        if msgs:
+            try:
+                self.stream.write(''.join(msgs))
+                self.flush()
+            except RecursionError:  # See issue 36272
+                raise
+            except Exception:
+                self.handleError(records[0])
+
     def setStream(self, stream):
         """
         Sets the StreamHandler's stream to the specified value,
@@ -1279,6 +1353,22 @@ def emit(self, record):
         if self.stream:
             StreamHandler.emit(self, record)
 
+    def emit_batch(self, records):
+        """
+        Emit a list of records.
+
+        If the stream was not opened because 'delay' was specified in the
+        constructor, open it before writing the records in one go.
+        """
+        if type(self).emit is not FileHandler.emit:
+            Handler.emit_batch(self, records)
+            return
+        if self.stream is None:
+            if self.mode != 'w' or not self._closed:
+                self.stream = self._open()
+        if self.stream:
+            self._write_batch(records)
+
     def __repr__(self):
         level = getLevelName(self.level)
         return '<%s %s (%s)>' % (self.__class__.__name__, self.baseFilename, level)
@@ -1462,17 +1552,27 @@ def _fixupChildren(self, ph, alogger):
                 alogger.parent = c.parent
                 c.parent = alogger
 
-    def _clear_cache(self):
+    def _clear_cache(self, alogger=None):
         """
-        Clear the cache for all loggers in loggerDict
+        Clear the cache for all loggers in loggerDict, or only for alogger
+        and its descendants if it is specified.
         Called when level changes are made
         """
 
         _acquireLock()
-        for logger in self.loggerDict.values():
-            if isinstance(logger, Logger):
-                logger._cache.clear()
-        self.root._cache.clear()
+        if alogger is None or alogger is self.root:
+            for logger in self.loggerDict.values():
+                if isinstance(logger, Logger):
+                    logger._cache.clear()
+            self.root._cache.clear()
+        else:
+            # Only the effective level of alogger and of the loggers below
+            # it in the hierarchy can depend on alogger's level.
+            alogger._cache.clear()
+            prefix = alogger.name + "."
+            for name, logger in self.loggerDict.items():
+                if isinstance(logger, Logger) and name.startswith(prefix):
+                    logger._cache.clear()
         _releaseLock()
 
 #---------------------------------------------------------------------------
@@ -1512,7 +1612,7 @@ def setLevel(self, level):
         Set the logging level of this logger.  level must be an int or a str.
         """
         self.level = _checkLevel(level)
-        self.manager._clear_cache()
+        self.manager._clear_cache(self)
 
     def debug(self, msg, *args, **kwargs):
         """
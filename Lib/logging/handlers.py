@@ -679,6 +679,31 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def emit_batch(self, records):
+        """
+        Emit a list of records.
+
+        The records are pickled as by emit() and all sent to the socket with
+        a single call to send(), so the receiving end sees exactly the same
+        data. If a subclass overrides emit() or send(), the records are
+        passed to emit() one by one instead.
+        """
+        if (type(self).emit is not SocketHandler.emit
+                or type(self).send is not SocketHandler.send):
+            logging.Handler.emit_batch(self, records)
+            return
+        data = []
+        for record in records:
+            try:
+                data.append(self.makePickle(record))
+            except Exception:
+                self.handleError(record)
+        if data:
+            try:
+                self.send(b''.join(data))
+            except Exception:
+                self.handleError(records[0])
+
     def close(self):
         """
         Closes the socket.
@@ -1509,15 +1534,22 @@ class QueueListener(object):
     """
     _sentinel = None
 
-    def __init__(self, queue, *handlers, respect_handler_level=False):
+    def __init__(self, queue, *handlers, respect_handler_level=False,
+                 batch_size=None):
         """
         Initialise an instance with the specified queue and
         handlers.
+
+        If batch_size is specified, up to that many records which are
+        already waiting in the queue are handled together by handle_batch().
         """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be None or >= 1")
         self.queue = queue
         self.handlers = handlers
         self._thread = None
         self.respect_handler_level = respect_handler_level
+        self.batch_size = batch_size
 
     def dequeue(self, block):
         """
@@ -1565,6 +1597,29 @@ def handle(self, record):
             if process:
                 handler.handle(record)
 
+    def handle_batch(self, records):
+        """
+        Handle a list of records.
+
+        The records are prepared, then each handler is given all of the
+        records it should process at once through its handle_batch() method.
+        """
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            if not self.respect_handler_level:
+                batch = records
+            else:
+                batch = [record for record in records
+                         if record.levelno >= handler.level]
+            if not batch:
+                continue
+            handle_batch = getattr(handler, 'handle_batch', None)
+            if handle_batch is not None:
+                handle_batch(batch)
+            else:
+                for record in batch:
+                    handler.handle(record)
+
     def _monitor(self):
         """
         Monitor the queue for records, and ask the handler
@@ -1575,6 +1630,9 @@ def _monitor(self):
         """
         q = self.queue
         has_task_done = hasattr(q, 'task_done')
+        if self.batch_size is not None:
+            self._monitor_batches(q, has_task_done)
+            return
         while True:
             try:
                 record = self.dequeue(True)
@@ -1588,6 +1646,32 @@ def _monitor(self):
             except queue.Empty:
                 break
 
+    def _monitor_batches(self, q, has_task_done):
+        # Block for the first record, then take whatever else is already
+        # queued, up to batch_size records.
+        stop = False
+        while not stop:
+            records = []
+            dequeued = 0
+            try:
+                record = self.dequeue(True)
+                while True:
+                    dequeued += 1
+                    if record is self._sentinel:
+                        stop = True
+                        break
+                    records.append(record)
+                    if len(records) >= self.batch_size:
+                        break
+                    record = self.dequeue(False)
+            except queue.Empty:
+                stop = not dequeued
+            if records:
+                self.handle_batch(records)
+            if has_task_done:
+                for _ in range(dequeued):
+                    q.task_done()
+
     def enqueue_sentinel(self):
         """
         This is used to enqueue the sentinel record.
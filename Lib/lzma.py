@@ -34,6 +34,10 @@
 # Value 2 no longer used
 _MODE_WRITE    = 3
 
+# Amount of input compressed to each stream by compress(workers=...).  This is
+# three times the dictionary size of the default preset, as used by xz -T.
+_PARALLEL_BLOCK_SIZE = 3 * 8 * 1024 * 1024
+
 
 class LZMAFile(_compression.BaseStream):
 
@@ -211,6 +215,23 @@ def read1(self, size=-1):
             size = io.DEFAULT_BUFFER_SIZE
         return self._buffer.read1(size)
 
+    def readinto(self, b):
+        """Read bytes into b.
+
+        Returns the number of bytes read (0 for EOF).
+        """
+        self._check_can_read()
+        return self._buffer.readinto(b)
+
+    def readinto1(self, b):
+        """Read bytes into b, while trying to avoid making multiple reads
+        from the underlying stream.
+
+        Returns the number of bytes read (0 for EOF).
+        """
+        self._check_can_read()
+        return self._buffer.readinto1(b)
+
     def readline(self, size=-1):
         """Read a line of uncompressed bytes from the file.
 
@@ -316,14 +337,34 @@ def open(filename, mode="rb", *,
         return binary_file
 
 
-def compress(data, format=FORMAT_XZ, check=-1, preset=None, filters=None):
+def compress(data, format=FORMAT_XZ, check=-1, preset=None, filters=None, *,
+             workers=None):
     """Compress a block of data.
 
     Refer to LZMACompressor's docstring for a description of the
     optional arguments *format*, *check*, *preset* and *filters*.
 
+    workers, if given and greater than 1, is the number of threads used to
+    compress large data.  The data is then split in pieces which are
+    compressed to concatenated .xz streams; this requires FORMAT_XZ.
+
     For incremental compression, use an LZMACompressor instead.
     """
+    if _compression._check_workers(workers):
+        if format != FORMAT_XZ:
+            raise ValueError("workers is only supported with FORMAT_XZ")
+        if memoryview(data).nbytes > _PARALLEL_BLOCK_SIZE:
+            data = memoryview(data).cast('B')
+
+            def compress_block(start):
+                comp = LZMACompressor(format, check, preset, filters)
+                block = data[start:start + _PARALLEL_BLOCK_SIZE]
+                return comp.compress(block) + comp.flush()
+
+            with _compression._thread_pool(workers) as executor:
+                return b"".join(executor.map(
+                    compress_block,
+                    range(0, len(data), _PARALLEL_BLOCK_SIZE)))
     comp = LZMACompressor(format, check, preset, filters)
     return comp.compress(data) + comp.flush()
 
@@ -42,6 +42,11 @@
 # A very generous timeout when it comes to local connections...
 CONNECTION_TIMEOUT = 20.
 
+# Messages larger than this are read by Connection straight into their final
+# buffer with os.readv() (on Windows, Connection handles are sockets).
+_LARGE_RECV_SIZE = 64 * 1024
+_readv = None if _winapi else getattr(os, 'readv', None)
+
 _mmap_counter = itertools.count()
 
 default_family = 'AF_INET'
@@ -371,6 +376,8 @@ def _send(self, buf, write=_write):
             buf = buf[n:]
 
     def _recv(self, size, read=_read):
+        if size > _LARGE_RECV_SIZE and _readv is not None:
+            return self._recv_into_buffer(size)
         buf = io.BytesIO()
         handle = self._handle
         remaining = size
@@ -382,10 +389,36 @@ def _recv(self, size, read=_read):
                     raise EOFError
                 else:
                     raise OSError("got end of file during message")
+            if n == size:
+                # The whole message was read at once: let the BytesIO share
+                # the bytes object rather than copying it.
+                buf = io.BytesIO(chunk)
+                buf.seek(n)
+                return buf
             buf.write(chunk)
             remaining -= n
         return buf
 
+    def _recv_into_buffer(self, size, readv=_readv):
+        # Read a large message directly into the BytesIO buffer, instead of
+        # allocating a temporary bytes object of the remaining size for
+        # every chunk delivered by the kernel and copying it.
+        buf = io.BytesIO()
+        buf.seek(size - 1)
+        buf.write(b'\0')
+        handle = self._handle
+        with buf.getbuffer() as view:
+            pos = 0
+            while pos < size:
+                n = readv(handle, [view[pos:]])
+                if n == 0:
+                    if pos == 0:
+                        raise EOFError
+                    else:
+                        raise OSError("got end of file during message")
+                pos += n
+        return buf
+
     def _send_bytes(self, buf):
         n = len(buf)
         if n > 0x7fffffff:
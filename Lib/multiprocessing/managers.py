@@ -244,56 +244,18 @@ def serve_client(self, conn):
 
         recv = conn.recv
         send = conn.send
-        id_to_obj = self.id_to_obj
 
         while not self.stop_event.is_set():
 
+            batch = None
             try:
-                methodname = obj = None
                 request = recv()
                 ident, methodname, args, kwds = request
-                try:
-                    obj, exposed, gettypeid = id_to_obj[ident]
-                except KeyError as ke:
-                    try:
-                        obj, exposed, gettypeid = \
-                            self.id_to_local_proxy_obj[ident]
-                    except KeyError:
-                        raise ke
-
-                if methodname not in exposed:
-                    raise AttributeError(
-                        'method %r of %r object is not in exposed=%r' %
-                        (methodname, type(obj), exposed)
-                        )
-
-                function = getattr(obj, methodname)
-
-                try:
-                    res = function(*args, **kwds)
-                except Exception as e:
-                    msg = ('#ERROR', e)
+                if methodname == '#BATCH':
+                    batch = self._serve_batch(conn, ident, args)
+                    msg = ('#RETURN', batch)
                 else:
-                    typeid = gettypeid and gettypeid.get(methodname, None)
-                    if typeid:
-                        rident, rexposed = self.create(conn, typeid, res)
-                        token = Token(typeid, self.address, rident)
-                        msg = ('#PROXY', (rexposed, token))
-                    else:
-                        msg = ('#RETURN', res)
-
-            except AttributeError:
-                if methodname is None:
-                    msg = ('#TRACEBACK', format_exc())
-                else:
-                    try:
-                        fallback_func = self.fallback_mapping[methodname]
-                        result = fallback_func(
-                            self, conn, ident, obj, *args, **kwds
-                            )
-                        msg = ('#RETURN', result)
-                    except Exception:
-                        msg = ('#TRACEBACK', format_exc())
+                    msg = self._serve_call(conn, ident, methodname, args, kwds)
 
             except EOFError:
                 util.debug('got EOF -- exiting thread serving %r',
@@ -307,6 +269,8 @@ def serve_client(self, conn):
                 try:
                     send(msg)
                 except Exception:
+                    if batch is not None:
+                        self._discard_batch(conn, batch)
                     send(('#UNSERIALIZABLE', format_exc()))
             except Exception as e:
                 util.info('exception in thread serving %r',
@@ -316,6 +280,77 @@ def serve_client(self, conn):
                 conn.close()
                 sys.exit(1)
 
+    def _serve_call(self, conn, ident, methodname, args, kwds):
+        '''
+        Call a method of the object identified by `ident` and return the
+        message to send back to the proxy
+        '''
+        obj = None
+        try:
+            try:
+                obj, exposed, gettypeid = self.id_to_obj[ident]
+            except KeyError as ke:
+                try:
+                    obj, exposed, gettypeid = \
+                        self.id_to_local_proxy_obj[ident]
+                except KeyError:
+                    raise ke
+
+            if methodname not in exposed:
+                raise AttributeError(
+                    'method %r of %r object is not in exposed=%r' %
+                    (methodname, type(obj), exposed)
+                    )
+
+            function = getattr(obj, methodname)
+
+            try:
+                res = function(*args, **kwds)
+            except Exception as e:
+                return ('#ERROR', e)
+
+            typeid = gettypeid and gettypeid.get(methodname, None)
+            if typeid:
+                rident, rexposed = self.create(conn, typeid, res)
+                token = Token(typeid, self.address, rident)
+                return ('#PROXY', (rexposed, token))
+            return ('#RETURN', res)
+
+        except AttributeError:
+            try:
+                fallback_func = self.fallback_mapping[methodname]
+                result = fallback_func(
+                    self, conn, ident, obj, *args, **kwds
+                    )
+                return ('#RETURN', result)
+            except Exception:
+                return ('#TRACEBACK', format_exc())
+
+        except Exception:
+            return ('#TRACEBACK', format_exc())
+
+    def _serve_batch(self, conn, ident, calls):
+        '''
+        Make several calls on the same object, stopping at the first failure
+        '''
+        msgs = []
+        for methodname, args, kwds in calls:
+            msg = self._serve_call(conn, ident, methodname, args, kwds)
+            msgs.append(msg)
+            if msg[0] not in ('#RETURN', '#PROXY'):
+                break
+        return msgs
+
+    def _discard_batch(self, conn, msgs):
+        '''
+        Release the shared objects created for a batch reply which could
+        not be sent
+        '''
+        for kind, result in msgs:
+            if kind == '#PROXY':
+                exposed, token = result
+                self.decref(conn, token.id)
+
     def fallback_getvalue(self, conn, ident, obj):
         return obj
 
@@ -809,17 +844,50 @@ def _callmethod(self, methodname, args=(), kwds={}):
         '''
         Try to call a method of the referent and return a copy of the result
         '''
+        conn = self._get_connection()
+
+        conn.send((self._id, methodname, args, kwds))
+        kind, result = conn.recv()
+        return self._unpack_result(kind, result)
+
+    def _callmethods(self, calls):
+        '''
+        Call several methods of the referent in one round trip and return
+        a list of copies of the results
+
+        Each item of `calls` is a tuple `(methodname[, args[, kwds]])`.
+        '''
+        batch = []
+        for call in calls:
+            if not isinstance(call, (tuple, list)) or not 1 <= len(call) <= 3:
+                raise TypeError(
+                    'each call must be a tuple (methodname[, args[, kwds]]), '
+                    'not %r' % (call,))
+            methodname, args, kwds = tuple(call) + ((), {})[len(call) - 1:]
+            if not isinstance(methodname, str):
+                raise TypeError(
+                    'method name must be a str, not %s'
+                    % type(methodname).__name__)
+            batch.append((methodname, tuple(args), dict(kwds)))
+        if not batch:
+            return []
+        conn = self._get_connection()
+        conn.send((self._id, '#BATCH', batch, {}))
+        kind, result = conn.recv()
+        if kind != '#RETURN':
+            raise convert_to_error(kind, result)
+        return [self._unpack_result(*msg) for msg in result]
+
+    def _get_connection(self):
         try:
-            conn = self._tls.connection
+            return self._tls.connection
         except AttributeError:
             util.debug('thread %r does not own a connection',
                        threading.current_thread().name)
             self._connect()
-            conn = self._tls.connection
-
-        conn.send((self._id, methodname, args, kwds))
-        kind, result = conn.recv()
+            return self._tls.connection
 
+    def _unpack_result(self, kind, result):
         if kind == '#RETURN':
             return result
         elif kind == '#PROXY':
@@ -8,7 +8,7 @@
 __all__ = [ 'SharedMemory', 'ShareableList' ]
 
 
-from functools import partial
+from functools import cached_property, partial
 import mmap
 import os
 import errno
@@ -423,30 +423,35 @@ def _set_packing_format_and_transform(self, position, fmt_as_str, value):
 
     def __getitem__(self, position):
         position = position if position >= 0 else position + self._list_len
-        try:
-            offset = self._offset_data_start + self._allocated_offsets[position]
-            (v,) = struct.unpack_from(
-                self._get_packing_format(position),
-                self.shm.buf,
-                offset
-            )
-        except IndexError:
+        if not 0 <= position < self._list_len:
             raise IndexError("index out of range")
 
-        back_transform = self._get_back_transform(position)
-        v = back_transform(v)
+        # Same as _get_packing_format() and _get_back_transform(), inlined
+        # since the position has already been checked.
+        buf = self.shm.buf
+        (fmt,) = struct.unpack_from(
+            "8s",
+            buf,
+            self._offset_packing_formats + position * 8
+        )
+        transform_code = buf[self._offset_back_transform_codes + position]
 
-        return v
+        (v,) = struct.unpack_from(
+            fmt.rstrip(b'\x00').decode(_encoding),
+            buf,
+            self._offset_data_start + self._allocated_offsets[position]
+        )
+        return self._back_transforms_mapping[transform_code](v)
 
     def __setitem__(self, position, value):
         position = position if position >= 0 else position + self._list_len
-        try:
-            item_offset = self._allocated_offsets[position]
-            offset = self._offset_data_start + item_offset
-            current_format = self._get_packing_format(position)
-        except IndexError:
+        if not 0 <= position < self._list_len:
             raise IndexError("assignment index out of range")
 
+        item_offset = self._allocated_offsets[position]
+        offset = self._offset_data_start + item_offset
+        current_format = self._get_packing_format(position)
+
         if not isinstance(value, (str, bytes)):
             new_format = self._types_mapping[type(value)]
             encoded_value = value
@@ -502,17 +507,20 @@ def _format_back_transform_codes(self):
         "The struct packing format used for the items' back transforms."
         return "b" * self._list_len
 
-    @property
+    # The offsets below only depend on the list length and the allocated
+    # offsets, which never change once the list is created or attached.
+
+    @cached_property
     def _offset_data_start(self):
         # - 8 bytes for the list length
         # - (N + 1) * 8 bytes for the element offsets
         return (self._list_len + 2) * 8
 
-    @property
+    @cached_property
     def _offset_packing_formats(self):
         return self._offset_data_start + self._allocated_offsets[-1]
 
-    @property
+    @cached_property
     def _offset_back_transform_codes(self):
         return self._offset_packing_formats + self._list_len * 8
 
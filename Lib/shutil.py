@@ -1004,11 +1004,13 @@ def _set_uid_gid(tarinfo):
     return archive_name
 
 def _make_zipfile(base_name, base_dir, verbose=0, dry_run=0,
-                  logger=None, owner=None, group=None, root_dir=None):
+                  logger=None, owner=None, group=None, root_dir=None,
+                  workers=None):
     """Create a zip file from all the files under 'base_dir'.
 
-    The output zip file will be named 'base_name' + ".zip".  Returns the
-    name of the output zip file.
+    The output zip file will be named 'base_name' + ".zip".  'workers' is
+    the number of threads used to compress the files.  Returns the name of
+    the output zip file.
     """
     import zipfile  # late import for breaking circular dependency
 
@@ -1027,7 +1029,8 @@ def _make_zipfile(base_name, base_dir, verbose=0, dry_run=0,
 
     if not dry_run:
         with zipfile.ZipFile(zip_filename, "w",
-                             compression=zipfile.ZIP_DEFLATED) as zf:
+                             compression=zipfile.ZIP_DEFLATED,
+                             workers=workers) as zf:
             arcname = os.path.normpath(base_dir)
             if root_dir is not None:
                 base_dir = os.path.join(root_dir, base_dir)
@@ -1062,6 +1065,7 @@ def _make_zipfile(base_name, base_dir, verbose=0, dry_run=0,
 
 _make_tarball.supports_root_dir = True
 _make_zipfile.supports_root_dir = True
+_make_zipfile.supports_workers = True
 
 # Maps the name of the archive format to a tuple containing:
 # * the archiving function
@@ -1120,7 +1124,8 @@ def unregister_archive_format(name):
     del _ARCHIVE_FORMATS[name]
 
 def make_archive(base_name, format, root_dir=None, base_dir=None, verbose=0,
-                 dry_run=0, owner=None, group=None, logger=None):
+                 dry_run=0, owner=None, group=None, logger=None, *,
+                 workers=None):
     """Create an archive file (eg. zip or tar).
 
     'base_name' is the name of the file to create, minus any format-specific
@@ -1136,6 +1141,10 @@ def make_archive(base_name, format, root_dir=None, base_dir=None, verbose=0,
 
     'owner' and 'group' are used when creating a tar archive. By default,
     uses the current owner and group.
+
+    'workers' is the number of threads used to compress the files when
+    creating a zip archive.  By default they are compressed one after the
+    other.
     """
     sys.audit("shutil.make_archive", base_name, format, root_dir, base_dir)
     try:
@@ -1149,6 +1158,8 @@ def make_archive(base_name, format, root_dir=None, base_dir=None, verbose=0,
     func = format_info[0]
     for arg, val in format_info[1]:
         kwargs[arg] = val
+    if workers is not None and getattr(func, 'supports_workers', False):
+        kwargs['workers'] = workers
 
     if base_dir is None:
         base_dir = os.curdir
@@ -2292,6 +2292,42 @@ def test_dict(self):
         self.assertEqual(sorted(d.values()), [chr(i) for i in indices])
         self.assertEqual(sorted(d.items()), [(i, chr(i)) for i in indices])
 
+    def test_callmethods(self):
+        d = self.dict()
+        self.assertEqual(d._callmethods([]), [])
+        results = d._callmethods([('__setitem__', (i, chr(i)))
+                                  for i in range(65, 70)])
+        self.assertEqual(results, [None] * 5)
+        self.assertEqual(d._callmethods([('__len__',),
+                                         ('get', (65,)),
+                                         ('get', (99, 'x'))]),
+                         [5, 'A', 'x'])
+        # results may be proxies to new shared objects
+        it, = d._callmethods([('__iter__',)])
+        self.assertEqual(sorted(it), list(range(65, 70)))
+
+        l = self.list([2, 0, 1])
+        self.assertEqual(l._callmethods([('sort', (), {'reverse': True}),
+                                         ('pop',), ('pop',)]),
+                         [None, 0, 1])
+        # the calls are made in order and stop at the first failure
+        with self.assertRaises(IndexError):
+            l._callmethods([('append', (1,)),
+                            ('__getitem__', (5,)),
+                            ('append', (2,))])
+        self.assertEqual(l[:], [2, 1])
+        with self.assertRaises(RemoteError):
+            l._callmethods([('append', (3,)), ('_h',)])
+        self.assertEqual(l[:], [2, 1, 3])
+        # malformed calls are rejected before anything is sent
+        for calls in (['pop'], [('append', (4,)), 'pop'], [()],
+                      [('append', (4,), {}, None)], [(len,)], [None]):
+            with self.subTest(calls=calls):
+                with self.assertRaises(TypeError):
+                    l._callmethods(calls)
+        self.assertEqual(l._callmethods([['append', [4]], ['pop']]), [None, 4])
+        self.assertEqual(l[:], [2, 1, 3])
+
     def test_dict_iter(self):
         d = self.dict()
         indices = list(range(65, 70))
@@ -2898,6 +2934,10 @@ def g(self):
         raise ValueError
     def _h(self):
         return '_h()'
+    def iter(self):
+        return iter(range(3))
+    def unpicklable(self):
+        return lambda: None
 
 def baz():
     for i in range(10):
@@ -2916,6 +2956,9 @@ class MyManager(BaseManager):
 MyManager.register('Foo', callable=FooBar)
 MyManager.register('Bar', callable=FooBar, exposed=('f', '_h'))
 MyManager.register('baz', callable=baz, proxytype=IteratorProxy)
+MyManager.register('FooIter', callable=FooBar,
+                   method_to_typeid={'iter': 'Iter'})
+MyManager.register('Iter', proxytype=IteratorProxy, create_method=False)
 
 
 class _TestMyManager(BaseTestCase):
@@ -2949,6 +2992,19 @@ def test_mymanager_context_prestarted(self):
             self.common(manager)
         self.assertEqual(manager._process.exitcode, 0)
 
+    def test_callmethods_unserializable(self):
+        manager = MyManager(shutdown_timeout=SHUTDOWN_TIMEOUT)
+        with manager:
+            foo = manager.FooIter()
+            it, = foo._callmethods([('iter',)])
+            self.assertEqual(next(it), 0)
+            del it
+            self.assertEqual(manager._number_of_objects(), 1)
+            with self.assertRaises(RemoteError):
+                foo._callmethods([('iter',), ('unpicklable',)])
+            # the shared object created by the first call must not leak
+            self.assertEqual(manager._number_of_objects(), 1)
+
     def common(self, manager):
         foo = manager.Foo()
         bar = manager.Bar()
@@ -3255,6 +3311,35 @@ def test_sendbytes(self):
 
         self.assertRaises(ValueError, a.send_bytes, msg, 4, -1)
 
+    def test_large_messages(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        msg = bytes(range(256)) * 4096   # 1 MiB
+        a, b = self.Pipe()
+
+        def send():
+            a.send_bytes(msg)
+            a.send_bytes(msg)
+            a.send(msg)
+        t = threading.Thread(target=send)
+        t.start()
+        try:
+            self.assertEqual(b.recv_bytes(), msg)
+            buffer = bytearray(len(msg) + 10)
+            self.assertEqual(b.recv_bytes_into(buffer, 10), len(msg))
+            self.assertEqual(buffer[10:], msg)
+            self.assertEqual(b.recv(), msg)
+        finally:
+            t.join()
+
+        # The peer closes the connection in the middle of a large message
+        os.write(a.fileno(), struct.pack("!i", len(msg)) + msg[:100])
+        a.close()
+        with self.assertRaisesRegex(OSError, 'end of file during message'):
+            b.recv_bytes()
+        b.close()
+
     @classmethod
     def _is_fd_assigned(cls, fd):
         try:
@@ -4157,10 +4242,20 @@ def test_shared_memory_ShareableList_basics(self):
         # Index Out of Range (get)
         with self.assertRaises(IndexError):
             sl[7]
+        with self.assertRaises(IndexError):
+            sl[-8]
+        with self.assertRaises(IndexError):
+            sl[-9]
 
         # Index Out of Range (set)
         with self.assertRaises(IndexError):
             sl[7] = 2
+        with self.assertRaises(IndexError):
+            sl[-8] = 2
+        with self.assertRaises(IndexError):
+            sl[-9] = 2
+        self.assertEqual(sl[-7], 'howdy')
+        self.assertEqual(sl[-1], 42)
 
         # Assign value without format change (str -> str)
         current_format = sl._get_packing_format(0)
@@ -5320,6 +5415,23 @@ def test_preload_resources(self):
             print(err)
             self.fail("failed spawning forkserver or grandchild")
 
+    @unittest.skipIf(sys.platform == "win32",
+                     "forkserver is not available on Windows")
+    def test_forkserver_preload_validation(self):
+        from multiprocessing import forkserver
+        server = forkserver.ForkServer()
+        server.set_forkserver_preload(('os', 'json'))
+        self.assertEqual(server._preload_modules, ['os', 'json'])
+        server.set_forkserver_preload(iter(['json', 'os']))
+        self.assertEqual(server._preload_modules, ['json', 'os'])
+        server.set_forkserver_preload(name for name in ('os', 'json'))
+        self.assertEqual(server._preload_modules, ['os', 'json'])
+        with self.assertRaises(TypeError):
+            server.set_forkserver_preload(['os', 1])
+        with self.assertRaises(TypeError):
+            server.set_forkserver_preload([b'os'])
+        self.assertEqual(server._preload_modules, ['os', 'json'])
+
 
 @unittest.skipIf(sys.platform == "win32",
                  "test semantics don't make sense on Windows")
@@ -413,19 +413,26 @@ def cb():
         not_cancelled_count = 1
         self.loop.call_later(3000, cb)
 
+        def cancel_later(handles):
+            # Schedule a later event first so that none of the cancelled
+            # handles sits at the tail of the heap, where cancel() would
+            # drop it immediately.
+            self.loop.call_later(7200, cb)
+            for h in handles:
+                h.cancel()
+            return 1
+
         # Add less than threshold (base_events._MIN_SCHEDULED_TIMER_HANDLES)
         # cancelled handles, ensure they aren't removed
 
         cancelled_count = 2
-        for x in range(2):
-            h = self.loop.call_later(3600, cb)
-            h.cancel()
+        not_cancelled_count += cancel_later(
+            [self.loop.call_later(3600, cb) for x in range(2)])
 
         # Add some cancelled events that will be at head and removed
         cancelled_count += 2
-        for x in range(2):
-            h = self.loop.call_later(100, cb)
-            h.cancel()
+        not_cancelled_count += cancel_later(
+            [self.loop.call_later(100, cb) for x in range(2)])
 
         # This test is invalid if _MIN_SCHEDULED_TIMER_HANDLES is too low
         self.assertLessEqual(cancelled_count + not_cancelled_count,
@@ -449,7 +456,7 @@ def cb():
             base_events._MIN_CANCELLED_TIMER_HANDLES_FRACTION)) + 1
 
         add_not_cancel_count = max(base_events._MIN_SCHEDULED_TIMER_HANDLES -
-            add_cancel_count, 0)
+            add_cancel_count - not_cancelled_count, 0)
 
         # Add some events that will not be cancelled
         not_cancelled_count += add_not_cancel_count
@@ -458,9 +465,8 @@ def cb():
 
         # Add enough cancelled events
         cancelled_count += add_cancel_count
-        for x in range(add_cancel_count):
-            h = self.loop.call_later(3600, cb)
-            h.cancel()
+        not_cancelled_count += cancel_later(
+            [self.loop.call_later(3600, cb) for x in range(add_cancel_count)])
 
         # Ensure all handles are still scheduled
         self.assertEqual(len(self.loop._scheduled),
@@ -474,6 +480,37 @@ def cb():
         # Ensure only uncancelled events remain scheduled
         self.assertTrue(all([not x._cancelled for x in self.loop._scheduled]))
 
+    def test_cancel_last_scheduled_timer(self):
+        def cb():
+            pass
+
+        h1 = self.loop.call_later(10, cb)
+        h2 = self.loop.call_later(20, cb)
+        h3 = self.loop.call_later(30, cb)
+        self.assertEqual(len(self.loop._scheduled), 3)
+
+        # The most recently scheduled handle is at the tail of the heap
+        # and is removed right away when cancelled.
+        h3.cancel()
+        self.assertEqual(len(self.loop._scheduled), 2)
+        self.assertFalse(h3._scheduled)
+        self.assertEqual(self.loop._timer_cancelled_count, 0)
+
+        # Other cancelled handles are removed lazily.
+        h1.cancel()
+        self.assertEqual(len(self.loop._scheduled), 2)
+        self.assertTrue(h1._scheduled)
+        self.assertEqual(self.loop._timer_cancelled_count, 1)
+
+        h2.cancel()
+        self.assertEqual(self.loop._scheduled, [h1])
+        self.assertEqual(self.loop._timer_cancelled_count, 1)
+
+        self.loop._process_events = mock.Mock()
+        self.loop._run_once()
+        self.assertEqual(self.loop._scheduled, [])
+        self.assertEqual(self.loop._timer_cancelled_count, 0)
+
     def test_run_until_complete_type_error(self):
         self.assertRaises(TypeError,
             self.loop.run_until_complete, 'blah')
@@ -1948,6 +1985,52 @@ async def stop_loop_coro(loop):
                          "^Executing <Task.*stop_loop_coro.*> "
                          "took .* seconds$")
 
+    def test_task_profiling(self):
+        async def sleeper():
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+        self.assertFalse(self.loop.get_task_profiling())
+        self.loop.run_until_complete(sleeper())
+
+        self.loop.set_task_profiling(True)
+        self.assertTrue(self.loop.get_task_profiling())
+        for task_class in (getattr(asyncio.tasks, '_CTask', None),
+                           asyncio.tasks._PyTask):
+            if task_class is None:
+                continue
+            with self.subTest(task_class=task_class):
+                task = task_class(sleeper(), loop=self.loop)
+                self.assertIsNone(self.loop.get_task_profile(task))
+                self.loop.run_until_complete(task)
+                profile = self.loop.get_task_profile(task)
+                self.assertEqual(profile.steps, 4)
+                self.assertGreaterEqual(profile.run_time, 0)
+                self.assertGreaterEqual(profile.wait_time, 0)
+
+        self.loop.set_task_profiling(False)
+        self.assertFalse(self.loop.get_task_profiling())
+        self.assertIsNone(self.loop.get_task_profile(task))
+
+    def test_task_profiling_wait_time(self):
+        # The wait starts when the task is scheduled, even if it is the
+        # first callback of the next event loop iteration.
+        fut = self.loop.create_future()
+
+        async def waiter():
+            await fut
+
+        self.loop.set_task_profiling(True)
+        task = self.loop.create_task(waiter())
+        test_utils.run_briefly(self.loop)
+        wait_time = self.loop.get_task_profile(task).wait_time
+        self.loop.call_soon(fut.set_result, None)
+        self.loop.call_soon(time.sleep, 0.1)
+        self.loop.run_until_complete(task)
+        profile = self.loop.get_task_profile(task)
+        self.assertEqual(profile.steps, 2)
+        self.assertGreaterEqual(profile.wait_time - wait_time, 0.09)
+
 
 class RunningLoopTests(unittest.TestCase):
 
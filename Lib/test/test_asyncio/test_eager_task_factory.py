@@ -81,6 +81,39 @@ async def run():
 
         self.assertEqual(self.run_coro(run()), 'hello')
 
+    def test_gather_eager_completion(self):
+
+        async def coro(i):
+            return i
+
+        async def run():
+            fut = asyncio.gather(coro(1), coro(2), coro(1))
+            # all children completed eagerly, so gather is done too
+            self.assertTrue(fut.done())
+            return await fut
+
+        self.assertEqual(self.run_coro(run()), [1, 2, 1])
+
+    def test_gather_eager_completion_exception(self):
+
+        async def coro(i):
+            if i:
+                raise ValueError(i)
+            return i
+
+        async def run(return_exceptions):
+            fut = asyncio.gather(coro(0), coro(1), coro(2),
+                                 return_exceptions=return_exceptions)
+            self.assertTrue(fut.done())
+            return await fut
+
+        with self.assertRaisesRegex(ValueError, '1'):
+            self.run_coro(run(False))
+        results = self.run_coro(run(True))
+        self.assertEqual(results[0], 0)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIsInstance(results[2], ValueError)
+
     def test_block_after_eager_step(self):
 
         async def coro():
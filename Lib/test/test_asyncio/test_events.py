@@ -2550,6 +2550,12 @@ def test_not_implemented(self):
             NotImplementedError, loop.default_exception_handler, f)
         self.assertRaises(
             NotImplementedError, loop.call_exception_handler, f)
+        self.assertRaises(
+            NotImplementedError, loop.get_task_profiling)
+        self.assertRaises(
+            NotImplementedError, loop.set_task_profiling, f)
+        self.assertRaises(
+            NotImplementedError, loop.get_task_profile, f)
         self.assertRaises(
             NotImplementedError, loop.get_debug)
         self.assertRaises(
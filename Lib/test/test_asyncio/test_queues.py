@@ -432,6 +432,121 @@ async def test_cancelled_put_silence_value_error_exception(self):
             await put_task
 
 
+class QueueManyTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_get_many(self):
+        q = asyncio.Queue()
+        for i in range(5):
+            q.put_nowait(i)
+
+        self.assertEqual([0, 1], await q.get_many(2))
+        self.assertEqual([2, 3, 4], await q.get_many())
+        self.assertTrue(q.empty())
+
+    async def test_get_many_wait(self):
+        loop = asyncio.get_running_loop()
+        q = asyncio.Queue()
+
+        get_task = asyncio.create_task(q.get_many(3))
+        await asyncio.sleep(0)
+        self.assertFalse(get_task.done())
+        loop.call_soon(q.put_nowait, 1)
+        self.assertEqual([1], await get_task)
+
+    async def test_get_many_max_items(self):
+        q = asyncio.Queue()
+        for max_items in (0, -1):
+            with self.assertRaises(ValueError):
+                await q.get_many(max_items)
+            with self.assertRaises(ValueError):
+                q.get_many_nowait(max_items)
+
+    def test_get_many_nowait(self):
+        q = asyncio.Queue()
+        self.assertRaises(asyncio.QueueEmpty, q.get_many_nowait)
+        for i in range(3):
+            q.put_nowait(i)
+        self.assertEqual([0], q.get_many_nowait(1))
+        self.assertEqual([1, 2], q.get_many_nowait(5))
+        self.assertRaises(asyncio.QueueEmpty, q.get_many_nowait)
+
+    async def test_get_many_wakes_putters(self):
+        q = asyncio.Queue(maxsize=2)
+        await q.put_many([0, 1])
+        put_task = asyncio.create_task(q.put_many([2, 3]))
+        await asyncio.sleep(0)
+        self.assertFalse(put_task.done())
+
+        self.assertEqual([0, 1], await q.get_many())
+        await put_task
+        self.assertEqual([2, 3], q.get_many_nowait())
+
+    async def test_get_many_cancelled(self):
+        q = asyncio.Queue()
+        get_task = asyncio.create_task(q.get_many())
+        await asyncio.sleep(0)
+        get_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await get_task
+        self.assertEqual(len(q._getters), 0)
+
+    async def test_put_many(self):
+        q = asyncio.Queue()
+        await q.put_many(iter(range(5)))
+        self.assertEqual(5, q.qsize())
+        self.assertEqual(5, q._unfinished_tasks)
+        self.assertEqual([0, 1, 2, 3, 4], q.get_many_nowait())
+
+    async def test_put_many_wait(self):
+        q = asyncio.Queue(maxsize=1)
+        items = []
+
+        async def consumer():
+            while len(items) < 5:
+                items.extend(await q.get_many())
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(q.put_many(range(5)))
+            tg.create_task(consumer())
+        self.assertEqual([0, 1, 2, 3, 4], items)
+
+
+class QueueStatisticsTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_high_water_mark(self):
+        q = asyncio.Queue()
+        self.assertEqual(0, q.high_water_mark)
+        await q.put_many(range(3))
+        q.get_nowait()
+        q.put_nowait(3)
+        self.assertEqual(3, q.high_water_mark)
+        q.get_many_nowait()
+        self.assertEqual(3, q.high_water_mark)
+        await q.put_many(range(4))
+        self.assertEqual(4, q.high_water_mark)
+
+    async def test_waits(self):
+        q = asyncio.Queue(maxsize=1)
+        self.assertEqual((0, 0), (q.put_waits, q.get_waits))
+        await q.put(0)
+        await q.get()
+        self.assertEqual((0, 0), (q.put_waits, q.get_waits))
+
+        get_task = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        await q.put(1)
+        self.assertEqual(1, await get_task)
+        self.assertEqual((0, 1), (q.put_waits, q.get_waits))
+
+        await q.put(2)
+        put_task = asyncio.create_task(q.put_many([3]))
+        await asyncio.sleep(0)
+        self.assertEqual([2], await q.get_many())
+        await put_task
+        self.assertEqual((1, 1), (q.put_waits, q.get_waits))
+        self.assertEqual(1, q.high_water_mark)
+
+
 class LifoQueueTests(unittest.IsolatedAsyncioTestCase):
 
     async def test_order(self):
@@ -442,6 +557,11 @@ async def test_order(self):
         items = [await q.get() for _ in range(3)]
         self.assertEqual([2, 3, 1], items)
 
+    async def test_get_many_order(self):
+        q = asyncio.LifoQueue()
+        await q.put_many([1, 3, 2])
+        self.assertEqual([2, 3, 1], await q.get_many())
+
 
 class PriorityQueueTests(unittest.IsolatedAsyncioTestCase):
 
@@ -453,6 +573,11 @@ async def test_order(self):
         items = [await q.get() for _ in range(3)]
         self.assertEqual([1, 2, 3], items)
 
+    async def test_get_many_order(self):
+        q = asyncio.PriorityQueue()
+        await q.put_many([1, 3, 2])
+        self.assertEqual([1, 2, 3], await q.get_many())
+
 
 class _QueueJoinTestMixin:
 
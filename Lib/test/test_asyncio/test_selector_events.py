@@ -177,6 +177,33 @@ def test_sock_connect_resolve_using_socket_params(self, m_gai):
                 self.loop.run_until_complete(con)
                 sock.connect.assert_called_with(('127.0.0.1', 0))
 
+    def test_sock_accept_registers_reader_once(self):
+        sock = test_utils.mock_nonblocking_socket()
+        sock.fileno.return_value = 10
+        conn = mock.Mock()
+        sock.accept.side_effect = [BlockingIOError, BlockingIOError,
+                                   (conn, ('127.0.0.1', 12345))]
+        self.loop._add_reader = mock.Mock(return_value=None)
+        self.loop._remove_reader = mock.Mock()
+
+        task = self.loop.create_task(self.loop.sock_accept(sock))
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(self.loop._add_reader.call_count, 1)
+        fd, cb, fut, _ = self.loop._add_reader.call_args[0]
+        self.assertEqual(fd, 10)
+
+        # A spurious wakeup must not register the reader again.
+        cb(fut, sock)
+        self.assertFalse(fut.done())
+        cb(fut, sock)
+        self.assertTrue(fut.done())
+        self.assertEqual(self.loop._add_reader.call_count, 1)
+
+        self.assertEqual(self.loop.run_until_complete(task),
+                         (conn, ('127.0.0.1', 12345)))
+        conn.setblocking.assert_called_with(False)
+        self.loop._remove_reader.assert_called_once_with(10)
+
     def test_add_reader(self):
         self.loop._selector.get_key.side_effect = KeyError
         cb = lambda: True
@@ -785,6 +812,46 @@ def test_writelines_sendmsg_partial(self):
         self.assertTrue(self.sock.sendmsg.called)
         self.assertTrue(self.loop.writers)
 
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_pending(self):
+        self.sock.sendmsg = mock.Mock()
+
+        transport = self.socket_transport(sendmsg=True)
+        transport._buffer.append(memoryview(b'data1'))
+        transport.writelines([b'data2', b'', b'data3'])
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertEqual(list_to_buffer([b'data1', b'data2', b'data3']),
+                         transport._buffer)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_empty_chunks(self):
+        self.sock.sendmsg = mock.Mock()
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines([b'', bytearray(), memoryview(b'')])
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertFalse(transport._buffer)
+        self.assertFalse(self.loop.writers)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_pauses_protocol(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.side_effect = BlockingIOError
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.set_write_buffer_limits(high=8)
+        transport.writelines([b'data1', b'data2'])
+        self.assertTrue(self.loop.writers)
+        self.assertTrue(self.protocol.pause_writing.called)
+
+    def test_writelines_conn_lost(self):
+        transport = self.socket_transport()
+        transport._conn_lost = 1
+        transport.writelines([b'data'])
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport._conn_lost, 2)
+
     def test_writelines_send_full(self):
         data = memoryview(b'data')
         self.sock.send.return_value = len(data)
@@ -401,6 +401,7 @@ def test_readuntil_multi_chunks(self):
         stream.feed_data(b'lineAAAxxx')
         data = self.loop.run_until_complete(stream.readuntil(b'AAA'))
         self.assertEqual(b'lineAAA', data)
+        self.assertIs(type(data), bytes)
         self.assertEqual(b'xxx', stream._buffer)
 
     def test_readuntil_multi_chunks_1(self):
@@ -199,6 +199,16 @@ def testReadInto(self):
             self.assertEqual(bz2f.readinto(b), n)
             self.assertEqual(b[:n], self.TEXT[-n:])
 
+    def testReadInto1(self):
+        self.createTempFile(streams=2)
+        with BZ2File(self.filename) as bz2f:
+            blocks = []
+            b = bytearray(100)
+            while n := bz2f.readinto1(b):
+                blocks.append(b[:n])
+            self.assertEqual(b"".join(blocks), self.TEXT * 2)
+            self.assertEqual(bz2f.readinto1(b), 0)
+
     def testReadLine(self):
         self.createTempFile()
         with BZ2File(self.filename) as bz2f:
@@ -770,6 +780,40 @@ def testDecompressorChunksMaxsize(self):
         self.assertEqual(out, self.BIG_TEXT)
         self.assertEqual(bzd.unused_data, b"")
 
+    def testDecompressInto(self):
+        bzd = BZ2Decompressor()
+        buf = bytearray(100)
+        out = []
+
+        # Feed some input
+        len_ = len(self.BIG_DATA) - 64
+        n = bzd.decompress_into(self.BIG_DATA[:len_], buf)
+        self.assertFalse(bzd.needs_input)
+        self.assertEqual(n, len(buf))
+        out.append(buf[:n])
+
+        # Retrieve more data while providing more input
+        n = bzd.decompress_into(self.BIG_DATA[len_:], memoryview(buf))
+        self.assertLessEqual(n, len(buf))
+        out.append(buf[:n])
+
+        # Retrieve remaining uncompressed data, into a buffer that is not a
+        # bytearray and has items larger than a byte
+        buf = array.array('I', bytes(100))
+        while not bzd.eof:
+            n = bzd.decompress_into(b'', buf)
+            self.assertLessEqual(n, 100)
+            out.append(buf.tobytes()[:n])
+
+        out = b"".join(out)
+        self.assertEqual(out, self.BIG_TEXT)
+        self.assertEqual(bzd.unused_data, b"")
+        self.assertRaises(EOFError, bzd.decompress_into, b"", buf)
+        self.assertRaises(TypeError, BZ2Decompressor().decompress_into,
+                          self.BIG_DATA, b"read-only")
+        n = BZ2Decompressor().decompress_into(self.BIG_DATA, bytearray())
+        self.assertEqual(n, 0)
+
     def test_decompressor_inputbuf_1(self):
         # Test reusing input buffer after moving existing
         # contents to beginning
@@ -858,6 +902,20 @@ def testCompressEmptyString(self):
         text = bz2.compress(b'')
         self.assertEqual(text, self.EMPTY_DATA)
 
+    def testCompressWorkers(self):
+        text = self.TEXT * 500
+        data = bz2.compress(text, 1, workers=3)
+        self.assertEqual(bz2.decompress(data), text)
+        self.assertEqual(ext_decompress(data), text)
+        with BZ2File(BytesIO(data)) as f:
+            self.assertEqual(f.read(), text)
+        self.assertEqual(bz2.decompress(bz2.compress(self.TEXT, workers=3)),
+                         self.TEXT)
+        self.assertRaises(ValueError, bz2.compress, self.TEXT, workers=0)
+        for compresslevel in (0, 10):
+            with self.assertRaisesRegex(ValueError, "compresslevel"):
+                bz2.compress(self.TEXT * 10_000, compresslevel, workers=2)
+
     def testDecompress(self):
         text = bz2.decompress(self.DATA)
         self.assertEqual(text, self.TEXT)
@@ -10,12 +10,14 @@
 import sys
 import unittest
 from subprocess import PIPE, Popen
+from test import support
 from test.support import import_helper
 from test.support import os_helper
 from test.support import _4G, bigmemtest, requires_subprocess
 from test.support.script_helper import assert_python_ok, assert_python_failure
 
 gzip = import_helper.import_module('gzip')
+zlib = import_helper.import_module('zlib')
 
 data1 = b"""  int length=DEFAULTALLOC, err = Z_OK;
   PyObject *RetVal;
@@ -139,6 +141,46 @@ def test_read1(self):
                 self.assertEqual(f.tell(), nread)
         self.assertEqual(b''.join(blocks), data1 * 50)
 
+    def test_readinto(self):
+        # Several members, read into buffers smaller and larger than them.
+        data = gzip.compress(data1) + gzip.compress(data2) * 2
+        for size in (1, 100, 4096, len(data1) + len(data2) * 2 + 1):
+            with self.subTest(size=size):
+                blocks = []
+                buf = bytearray(size)
+                with gzip.GzipFile(fileobj=io.BytesIO(data)) as f:
+                    # readinto() must not fall back to read().
+                    f.read = f.read1 = None
+                    while n := f.readinto(buf):
+                        blocks.append(buf[:n])
+                        self.assertEqual(f.tell(), sum(map(len, blocks)))
+                    self.assertEqual(f.readinto(buf), 0)
+                self.assertEqual(b''.join(blocks), data1 + data2 * 2)
+        # The CRC is computed over the data written into the buffer.
+        corrupt = bytearray(gzip.compress(data1))
+        corrupt[-8] ^= 1
+        with gzip.GzipFile(fileobj=io.BytesIO(corrupt)) as f:
+            with self.assertRaises(gzip.BadGzipFile):
+                while f.readinto(bytearray(100)):
+                    pass
+
+    def test_readinto1(self):
+        data = gzip.compress(data1) + gzip.compress(data2) * 2
+        blocks = []
+        buf = bytearray(100)
+        with gzip.GzipFile(fileobj=io.BytesIO(data)) as f:
+            f.read = f.read1 = None
+            while n := f.readinto1(buf):
+                blocks.append(buf[:n])
+                self.assertEqual(f.tell(), sum(map(len, blocks)))
+            self.assertEqual(f.readinto1(buf), 0)
+        self.assertEqual(b''.join(blocks), data1 + data2 * 2)
+
+    def test_readinto_write_mode(self):
+        with gzip.GzipFile(fileobj=io.BytesIO(), mode='wb') as f:
+            self.assertRaises(OSError, f.readinto, bytearray(10))
+            self.assertRaises(OSError, f.readinto1, bytearray(10))
+
     @bigmemtest(size=_4G, memuse=1)
     def test_read_large(self, size):
         # Read chunk size over UINT_MAX should be supported, despite zlib's
@@ -561,6 +603,25 @@ def test_compress_correct_level(self):
                 self.assertIn(data1, nocompress)
                 self.assertNotIn(data1, yescompress)
 
+    def test_compress_workers(self):
+        data = (data1 + data2) * 50
+        with support.swap_attr(gzip, '_PARALLEL_BLOCK_SIZE', 1000):
+            for args in [(), (1,), (6,), (9,)]:
+                for mtime in (0, 42):
+                    with self.subTest(args=args, mtime=mtime):
+                        datac = gzip.compress(data, *args, mtime=mtime,
+                                              workers=3)
+                        self.assertEqual(gzip.decompress(datac), data)
+                        self.assertEqual(zlib.decompress(datac, 31), data)
+                        with gzip.GzipFile(fileobj=io.BytesIO(datac)) as f:
+                            self.assertEqual(f.read(), data)
+                            self.assertEqual(f.mtime, mtime)
+            # Data of any buffer type, and smaller than a block.
+            for data in [array.array('I', range(1000)), b'', data1]:
+                datac = gzip.compress(data, workers=3)
+                self.assertEqual(gzip.decompress(datac), bytes(data))
+        self.assertRaises(ValueError, gzip.compress, data1, workers=0)
+
     def test_decompress(self):
         for data in (data1, data2):
             buf = io.BytesIO()
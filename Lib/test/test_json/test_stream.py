@@ -0,0 +1,149 @@
+from io import BytesIO, StringIO
+from test.test_json import PyTest, CTest
+
+
+DOCS = [
+    {"a": [1, 2.5, -3e10, "x€\U0001d11e\"\\"], "b": None, "c": True},
+    123, -0.5, "str", [], {}, False, None, 1e5, 7, float('inf'),
+]
+
+
+class TestStream:
+    def feed(self, text, chunk_size, **kwargs):
+        decoder = self.json.JSONStreamDecoder(**kwargs)
+        values = []
+        for i in range(0, len(text), chunk_size):
+            values += decoder.decode(text[i:i + chunk_size])
+        values += decoder.decode('', final=True)
+        return values
+
+    def test_values(self):
+        text = '\n'.join(self.dumps(doc, ensure_ascii=i % 2)
+                         for i, doc in enumerate(DOCS))
+        for chunk_size in (1, 2, 3, 7, len(text)):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.feed(text, chunk_size), DOCS)
+        self.assertEqual(self.feed('{"a": 1}\t{"b": 2}\r\n[3] "4"', 1),
+                         [{"a": 1}, {"b": 2}, [3], "4"])
+        self.assertEqual(self.feed(' \n ', 1), [])
+        self.assertEqual(self.feed('', 1), [])
+
+    def test_array(self):
+        text = self.dumps(DOCS, indent=1)
+        for chunk_size in (1, 2, 3, 7, len(text)):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.feed(text, chunk_size, array=True),
+                                 DOCS)
+        self.assertEqual(self.feed(' [ ] ', 1, array=True), [])
+
+    def test_values_as_completed(self):
+        decoder = self.json.JSONStreamDecoder()
+        self.assertEqual(decoder.decode('{"a": [1, '), [])
+        self.assertEqual(decoder.decode('2]'), [])
+        self.assertEqual(decoder.decode('}   {"b"'), [{"a": [1, 2]}])
+        self.assertEqual(decoder.decode(': 3}\n12'), [{"b": 3}])
+        # A number at the end of the text may not be complete yet.
+        self.assertEqual(decoder.decode('3'), [])
+        self.assertEqual(decoder.decode('\n'), [123])
+        self.assertEqual(decoder.decode('1.'), [])
+        self.assertEqual(decoder.decode('5', final=True), [1.5])
+
+        # A value is returned by the call that completes it, however small
+        # the piece is compared to the value.
+        record = self.dumps({"a": ["x" * 10, '"]}\\'] * 50, "b": 1})
+        decoder = self.json.JSONStreamDecoder()
+        self.assertEqual(decoder.decode(record[:-10]), [])
+        self.assertEqual(decoder.decode(record[-10:] + '\n'),
+                         [self.loads(record)])
+        self.assertEqual(decoder.decode('{"a":1}\n'), [{"a": 1}])
+        for split in range(1, len(record)):
+            with self.subTest(split=split):
+                decoder = self.json.JSONStreamDecoder()
+                self.assertEqual(decoder.decode(record[:split]), [])
+                self.assertEqual(decoder.decode(record[split:]),
+                                 [self.loads(record)])
+        decoder = self.json.JSONStreamDecoder()
+        self.assertEqual(decoder.decode('"a\\'), [])
+        self.assertEqual(decoder.decode('"'), [])
+        self.assertEqual(decoder.decode('"'), ['a"'])
+
+        decoder = self.json.JSONStreamDecoder(array=True)
+        self.assertEqual(decoder.decode('[{"a": 1}, {"b'), [{"a": 1}])
+        self.assertEqual(decoder.decode('": 2}, tr'), [{"b": 2}])
+        self.assertEqual(decoder.decode('ue]'), [True])
+        self.assertEqual(decoder.decode('', final=True), [])
+
+    def test_decoder(self):
+        decoder = self.json.JSONDecoder(parse_int=str, object_pairs_hook=list)
+        stream = self.json.JSONStreamDecoder(decoder, array=True)
+        self.assertIs(stream.decoder, decoder)
+        self.assertEqual(stream.decode('[1, {"a": 2}]', final=True),
+                         ['1', [('a', '2')]])
+
+    def test_errors(self):
+        for text, array, msg in [
+            ('[1,]', True, 'Expecting value'),
+            ('[1 2]', True, "Expecting ',' delimiter"),
+            ('[1]]', True, 'Extra data'),
+            ('[1] 2', True, 'Extra data'),
+            ('{"a": 1}', True, "Expecting '['"),
+            ('[', True, 'Expecting value'),
+            ('[1', True, "Expecting ',' delimiter"),
+            ('', True, 'Expecting value'),
+            ('{"a" 1}', False, "Expecting ':' delimiter"),
+            ('1 x', False, 'Expecting value'),
+            ('1-2 3', False, 'Extra data'),
+            ('1.5x', False, 'Extra data'),
+            ('[1]2', False, 'Extra data'),
+            ('"a"true', False, 'Extra data'),
+            ('{"a": 1}{"b": 2}', False, 'Extra data'),
+            ('[tx]', False, 'Expecting value'),
+            ('tru', False, 'Expecting value'),
+            ('"abc', False, 'Unterminated string starting at'),
+            ('"\\u00', False, 'Invalid \\uXXXX escape'),
+            ('{"a": 1', False, "Expecting ',' delimiter"),
+            ('{"a": [1}', False, "Expecting ',' delimiter"),
+            ('{"a": [1, x]}', False, 'Expecting value'),
+        ]:
+            for chunk_size in (1, len(text) or 1):
+                with self.subTest(text=text, chunk_size=chunk_size):
+                    with self.assertRaises(self.JSONDecodeError) as cm:
+                        self.feed(text, chunk_size, array=array)
+                    self.assertEqual(cm.exception.msg, msg)
+        # Invalid data is reported as soon as it is seen.
+        decoder = self.json.JSONStreamDecoder(array=True)
+        self.assertRaises(self.JSONDecodeError, decoder.decode, '[1, x')
+        decoder = self.json.JSONStreamDecoder()
+        self.assertRaises(TypeError, decoder.decode, b'1')
+
+    def test_iterload(self):
+        text = '\n'.join(map(self.dumps, DOCS)) + '\n'
+        self.assertEqual(list(self.json.iterload(StringIO(text))), DOCS)
+        array = self.dumps(DOCS)
+        self.assertEqual(list(self.json.iterload(StringIO(array), array=True)),
+                         DOCS)
+        self.assertEqual(list(self.json.iterload(StringIO(''))), [])
+        self.assertEqual(list(self.json.iterload(
+            StringIO('[1, 2]'), array=True, parse_int=float)), [1.0, 2.0])
+
+    def test_iterload_bytes(self):
+        text = '\n'.join(self.dumps(doc, ensure_ascii=False) for doc in DOCS)
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le',
+                         'utf-16-be', 'utf-32', 'utf-32-le', 'utf-32-be'):
+            with self.subTest(encoding=encoding):
+                data = text.encode(encoding)
+                self.assertEqual(list(self.json.iterload(BytesIO(data))), DOCS)
+        # The file is read in chunks which may split characters.
+        data = ('"€"\n' * 30000).encode()
+        self.assertEqual(list(self.json.iterload(BytesIO(data))),
+                         ['€'] * 30000)
+
+    def test_iterload_errors(self):
+        with self.assertRaises(self.JSONDecodeError):
+            list(self.json.iterload(StringIO('\ufeff[]')))
+        with self.assertRaises(self.JSONDecodeError):
+            list(self.json.iterload(StringIO('[1, 2'), array=True))
+
+
+class TestPyStream(TestStream, PyTest): pass
+class TestCStream(TestStream, CTest): pass
@@ -857,6 +857,44 @@ def test_can_represent_stream_with_int_name(self):
         h = logging.StreamHandler(StreamWithIntName())
         self.assertEqual(repr(h), '<StreamHandler 2 (NOTSET)>')
 
+    def test_handle_batch(self):
+        class CountingStream(io.StringIO):
+            writes = 0
+            def write(self, s):
+                self.writes += 1
+                return super().write(s)
+
+        stream = CountingStream()
+        h = logging.StreamHandler(stream)
+        h.addFilter(lambda record: record.msg != 'skip')
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('a', 'skip', 'b', 'c')]
+        emitted = h.handle_batch(records)
+        self.assertEqual([r.msg for r in emitted], ['a', 'b', 'c'])
+        self.assertEqual(stream.getvalue(), 'a\nb\nc\n')
+        self.assertEqual(stream.writes, 1)
+        self.assertEqual(h.handle_batch(records[1:2]), [])
+        self.assertEqual(stream.writes, 1)
+
+        # Subclasses overriding emit() get the records one by one.
+        class EmittingHandler(logging.StreamHandler):
+            def emit(self, record):
+                record.msg = record.msg.upper()
+                super().emit(record)
+
+        stream = CountingStream()
+        h = EmittingHandler(stream)
+        h.handle_batch([logging.makeLogRecord({'msg': msg})
+                        for msg in ('a', 'b')])
+        self.assertEqual(stream.getvalue(), 'A\nB\n')
+        self.assertEqual(stream.writes, 2)
+
+    def test_handle_batch_error_handling(self):
+        h = TestStreamHandler(BadStream())
+        r = logging.makeLogRecord({})
+        h.handle_batch([r, logging.makeLogRecord({})])
+        self.assertIs(h.error_record, r)
+
 # -- The following section could be moved into a server_helper.py module
 # -- if it proves to be of wider utility than just test_logging
 
@@ -1909,6 +1947,24 @@ def test_output(self):
         self.handled.acquire()
         self.assertEqual(self.log_output, "spam\neggs\n")
 
+    def test_output_batch(self):
+        # A batch of records is sent at once, in the same format.
+        if self.server_exception:
+            self.skipTest(self.server_exception)
+        sent = []
+        send = self.sock_hdlr.send
+        def counting_send(s):
+            sent.append(s)
+            send(s)
+        self.sock_hdlr.send = counting_send
+        records = [logging.makeLogRecord({'msg': msg, 'args': (i,)})
+                   for i, msg in enumerate(["spam %d", "eggs %d", "ham %d"])]
+        self.sock_hdlr.handle_batch(records)
+        for _ in records:
+            self.handled.acquire()
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(self.log_output, "spam 0\neggs 1\nham 2\n")
+
     def test_noserver(self):
         if self.server_exception:
             self.skipTest(self.server_exception)
@@ -2009,6 +2065,18 @@ def test_output(self):
         self.handled.wait()
         self.assertEqual(self.log_output, "spam\neggs\n")
 
+    def test_output_batch(self):
+        # Each record of a batch is still sent in its own datagram.
+        if self.server_exception:
+            self.skipTest(self.server_exception)
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ["spam", "eggs"]]
+        self.sock_hdlr.handle_batch(records)
+        for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+            if self.log_output.count("\n") == 2:
+                break
+        self.assertEqual(sorted(self.log_output.split()), ["eggs", "spam"])
+
 @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets required")
 class UnixDatagramHandlerTest(DatagramHandlerTest):
 
@@ -4047,6 +4115,68 @@ def test_queue_listener_with_multiple_handlers(self):
         listener.stop()
         self.assertEqual(self.stream.getvalue().strip(), "que -> ERROR: error")
 
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batch_size(self):
+        self.assertRaises(ValueError, logging.handlers.QueueListener,
+                          self.queue, batch_size=0)
+
+        batch_sizes = []
+
+        class BatchHandler(TestHandler):
+            def emit_batch(self, records):
+                batch_sizes.append(len(records))
+                super().emit_batch(records)
+
+        handler = BatchHandler(support.Matcher())
+        error_handler = TestHandler(support.Matcher())
+        error_handler.setLevel(logging.ERROR)
+        listener = logging.handlers.QueueListener(
+            self.queue, handler, error_handler,
+            respect_handler_level=True, batch_size=3)
+        for i in range(5):
+            self.que_logger.log(logging.ERROR if i % 2 else logging.WARNING,
+                                str(i))
+        # All the records are queued before the listener starts, so they
+        # are handled in two batches.
+        listener.start()
+        listener.stop()
+        self.assertEqual(batch_sizes, [3, 2])
+        self.assertEqual([r['msg'] for r in handler.buffer],
+                         ['0', '1', '2', '3', '4'])
+        self.assertEqual([r['msg'] for r in error_handler.buffer], ['1', '3'])
+        self.assertEqual(self.queue.unfinished_tasks, 0)
+        handler.close()
+        error_handler.close()
+
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batch_size_handle_override(self):
+        # A handler which overrides handle() still sees every record.
+        class TaggingHandler(TestHandler):
+            def handle(self, record):
+                record.msg = 'tagged ' + record.msg
+                return super().handle(record)
+
+        handler = TaggingHandler(support.Matcher())
+        listener = logging.handlers.QueueListener(
+            self.queue, handler, batch_size=3)
+        for i in range(4):
+            self.que_logger.warning(str(i))
+        listener.start()
+        listener.stop()
+        self.assertEqual([r['msg'] for r in handler.buffer],
+                         ['tagged 0', 'tagged 1', 'tagged 2', 'tagged 3'])
+        handler.close()
+
+        handler = TaggingHandler(support.Matcher())
+        handler.addFilter(lambda record: not record.msg.endswith('skip'))
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('a', 'skip', 'b')]
+        self.assertEqual([r.msg for r in handler.handle_batch(records)],
+                         ['tagged a', 'tagged b'])
+        handler.close()
+
 if hasattr(logging.handlers, 'QueueListener'):
     import multiprocessing
     from unittest.mock import patch
@@ -5634,11 +5764,29 @@ def test_caching(self):
         # Ensure logger2 uses parent logger's effective level
         self.assertFalse(logger2.isEnabledFor(logging.ERROR))
 
+        # Ensure only the caches of the logger and its descendants were
+        # cleared
+        self.assertEqual(root._cache, {logging.ERROR: True})
+        self.assertEqual(logger1._cache, {})
+
         # Set level to NOTSET and ensure caches are empty
+        logger1.isEnabledFor(logging.ERROR)
         logger2.setLevel(logging.NOTSET)
         self.assertEqual(logger2.getEffectiveLevel(), logging.CRITICAL)
         self.assertEqual(logger2._cache, {})
+        self.assertEqual(logger1._cache, {logging.ERROR: False})
+        self.assertEqual(root._cache, {logging.ERROR: True})
+
+        # Ensure siblings with a common name prefix are left alone
+        sibling = logging.getLogger("abcd")
+        self.assertTrue(sibling.isEnabledFor(logging.ERROR))
+        logger1.setLevel(logging.CRITICAL)
+        self.assertEqual(sibling._cache, {logging.ERROR: True})
         self.assertEqual(logger1._cache, {})
+
+        # Ensure setting the root level clears every cache
+        root.setLevel(logging.ERROR)
+        self.assertEqual(sibling._cache, {})
         self.assertEqual(root._cache, {})
 
         # Verify logger2 follows parent and not root
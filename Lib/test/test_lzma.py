@@ -189,6 +189,40 @@ def test_decompressor_chunks_maxsize(self):
         self.assertEqual(lzd.check, lzma.CHECK_CRC64)
         self.assertEqual(lzd.unused_data, b"")
 
+    def test_decompress_into(self):
+        lzd = LZMADecompressor()
+        buf = bytearray(100)
+        out = []
+
+        # Feed first half the input
+        len_ = len(COMPRESSED_XZ) // 2
+        n = lzd.decompress_into(COMPRESSED_XZ[:len_], buf)
+        self.assertFalse(lzd.needs_input)
+        self.assertEqual(n, len(buf))
+        out.append(buf[:n])
+
+        # Retrieve more data while providing more input
+        n = lzd.decompress_into(COMPRESSED_XZ[len_:], memoryview(buf))
+        self.assertLessEqual(n, len(buf))
+        out.append(buf[:n])
+
+        # Retrieve remaining uncompressed data, into a buffer that is not a
+        # bytearray and has items larger than a byte
+        buf = array.array('I', bytes(100))
+        while not lzd.eof:
+            n = lzd.decompress_into(b'', buf)
+            self.assertLessEqual(n, 100)
+            out.append(buf.tobytes()[:n])
+
+        out = b"".join(out)
+        self.assertEqual(out, INPUT)
+        self.assertEqual(lzd.unused_data, b"")
+        self.assertRaises(EOFError, lzd.decompress_into, b"", buf)
+        self.assertRaises(TypeError, LZMADecompressor().decompress_into,
+                          COMPRESSED_XZ, b"read-only")
+        n = LZMADecompressor().decompress_into(COMPRESSED_XZ, bytearray())
+        self.assertEqual(n, 0)
+
     def test_decompressor_inputbuf_1(self):
         # Test reusing input buffer after moving existing
         # contents to beginning
@@ -505,6 +539,22 @@ def test_roundtrip(self):
 
     # Unlike LZMADecompressor, decompress() *does* handle concatenated streams.
 
+    def test_compress_workers(self):
+        data = INPUT * 20
+        with support.swap_attr(lzma, '_PARALLEL_BLOCK_SIZE', 1000):
+            compressed = lzma.compress(data, workers=3)
+            self.assertEqual(lzma.decompress(compressed), data)
+            with LZMAFile(BytesIO(compressed)) as f:
+                self.assertEqual(f.read(), data)
+            compressed = lzma.compress(data, check=lzma.CHECK_NONE,
+                                       filters=FILTERS_RAW_1, workers=3)
+            self.assertEqual(lzma.decompress(compressed), data)
+            self.assertEqual(lzma.decompress(lzma.compress(b"", workers=3)),
+                             b"")
+            with self.assertRaises(ValueError):
+                lzma.compress(data, format=lzma.FORMAT_ALONE, workers=3)
+        self.assertRaises(ValueError, lzma.compress, data, workers=0)
+
     def test_decompress_multistream(self):
         ddata = lzma.decompress(COMPRESSED_XZ + COMPRESSED_ALONE)
         self.assertEqual(ddata, INPUT * 2)
@@ -946,6 +996,41 @@ def test_read1_bad_args(self):
         with LZMAFile(BytesIO(COMPRESSED_XZ)) as f:
             self.assertRaises(TypeError, f.read1, None)
 
+    def test_readinto(self):
+        for size in (1, 100, len(INPUT) + 1):
+            with self.subTest(size=size):
+                with LZMAFile(BytesIO(COMPRESSED_XZ * 2)) as f:
+                    # readinto() must not fall back to read().
+                    f.read = f.read1 = None
+                    blocks = []
+                    buf = bytearray(size)
+                    while n := f.readinto(buf):
+                        blocks.append(buf[:n])
+                        self.assertEqual(f.tell(), sum(map(len, blocks)))
+                    self.assertEqual(b"".join(blocks), INPUT * 2)
+                    self.assertEqual(f.readinto(buf), 0)
+
+    def test_readinto1(self):
+        with LZMAFile(BytesIO(COMPRESSED_XZ * 2)) as f:
+            f.read = f.read1 = None
+            blocks = []
+            buf = bytearray(100)
+            while n := f.readinto1(buf):
+                blocks.append(buf[:n])
+            self.assertEqual(b"".join(blocks), INPUT * 2)
+            self.assertEqual(f.readinto1(buf), 0)
+
+    def test_readinto_bad_args(self):
+        f = LZMAFile(BytesIO(COMPRESSED_XZ))
+        f.close()
+        self.assertRaises(ValueError, f.readinto, bytearray(10))
+        self.assertRaises(ValueError, f.readinto1, bytearray(10))
+        with LZMAFile(BytesIO(), "w") as f:
+            self.assertRaises(ValueError, f.readinto, bytearray(10))
+            self.assertRaises(ValueError, f.readinto1, bytearray(10))
+        with LZMAFile(BytesIO(COMPRESSED_XZ)) as f:
+            self.assertRaises(TypeError, f.readinto, b"read-only")
+
     def test_peek(self):
         with LZMAFile(BytesIO(COMPRESSED_XZ)) as f:
             result = f.peek()
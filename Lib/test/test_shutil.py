@@ -1641,6 +1641,27 @@ def test_make_zipfile(self):
                     ['dist/', 'dist/sub/', 'dist/sub2/',
                      'dist/file1', 'dist/file2', 'dist/sub/file3'])
 
+    @support.requires_zlib()
+    def test_make_zipfile_workers(self):
+        root_dir, base_dir = self._create_files()
+        base_name = os.path.join(self.mkdtemp(), 'archive')
+        with no_chdir:
+            res = make_archive(base_name, 'zip', root_dir, base_dir,
+                               workers=4)
+        self.assertEqual(res, base_name + '.zip')
+        with zipfile.ZipFile(res) as zf:
+            self.assertIsNone(zf.testzip())
+            self.assertCountEqual(zf.namelist(),
+                    ['dist/', 'dist/sub/', 'dist/sub2/',
+                     'dist/file1', 'dist/file2', 'dist/sub/file3'])
+            self.assertEqual(zf.read('dist/sub/file3'), b'xxx')
+
+        # Other formats ignore workers.
+        with no_chdir:
+            res = make_archive(base_name, 'tar', root_dir, base_dir,
+                               workers=4)
+        self.assertTrue(os.path.isfile(res))
+
     @support.requires_zlib()
     @unittest.skipUnless(shutil.which('zip'),
                          'Need the zip command to run')
@@ -9,6 +9,7 @@
 import struct
 import subprocess
 import sys
+import threading
 import time
 import unittest
 import unittest.mock as mock
@@ -1284,6 +1285,80 @@ def test_issue44439(self):
                 self.assertEqual(data.write(q), LENGTH)
             self.assertEqual(zip.getinfo('data').file_size, LENGTH)
 
+    def make_tree(self):
+        os.mkdir(TESTFNDIR)
+        self.addCleanup(rmtree, TESTFNDIR)
+        os.mkdir(os.path.join(TESTFNDIR, 'sub'))
+        for i in range(20):
+            with open(os.path.join(TESTFNDIR, f'f{i}'), 'wb') as f:
+                f.write(b'%d' % i * (i * 500))
+
+    def test_write_workers(self):
+        self.make_tree()
+        def create(filename, workers):
+            with zipfile.ZipFile(filename, "w", self.compression,
+                                 workers=workers) as zipf:
+                zipf.write(os.path.join(TESTFNDIR, 'sub'), 'sub')
+                for i in range(20):
+                    zipf.write(os.path.join(TESTFNDIR, f'f{i}'), f'f{i}')
+                    zinfo = zipfile.ZipInfo(f's{i}', (2000, 1, 1, 0, 0, 0))
+                    zipf.writestr(zinfo, b'%d' % i * 100, self.compression)
+                # Reading the archive writes the pending members first.
+                self.assertEqual(zipf.read('f3'), b'3' * 1500)
+                zipf.mkdir('dir')
+                zipf.writestr(zipfile.ZipInfo('last'), b'last')
+            with open(filename, 'rb') as f:
+                return f.read()
+
+        self.addCleanup(unlink, TESTFN)
+        expected = create(TESTFN, None)
+        for workers in (1, 2, 8):
+            with self.subTest(workers=workers):
+                self.assertEqual(create(TESTFN2, workers), expected)
+        with self.assertRaises(ValueError):
+            zipfile.ZipFile(TESTFN2, "w", workers=0)
+
+    def test_write_workers_unseekable(self):
+        f = io.BytesIO()
+        with zipfile.ZipFile(Unseekable(f), 'w', self.compression,
+                             workers=2) as zipf:
+            for i in range(10):
+                zipf.writestr(f'f{i}', b'%d' % i * 100)
+        with zipfile.ZipFile(f) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(zipf.namelist(), [f'f{i}' for i in range(10)])
+            for i in range(10):
+                self.assertEqual(zipf.read(f'f{i}'), b'%d' % i * 100)
+
+    def test_write_workers_error(self):
+        # A member which fails to compress is left out of the archive and
+        # the error is raised by a later call.
+        compress_data = zipfile._compress_data
+        def fail_on_bad(data, *args):
+            if data == b'bad':
+                raise OSError('bad')
+            return compress_data(data, *args)
+        with mock.patch.object(zipfile, '_compress_data', fail_on_bad):
+            with self.assertRaisesRegex(OSError, 'bad'):
+                with zipfile.ZipFile(TESTFN2, "w", self.compression,
+                                     workers=2) as zipf:
+                    zipf.writestr('f1', b'1')
+                    zipf.writestr('f2', b'bad')
+                    zipf.writestr('f3', b'3')
+            with zipfile.ZipFile(TESTFN2, "a", self.compression,
+                                 workers=2) as zipf:
+                zipf.writestr('f4', b'bad')
+                with self.assertRaisesRegex(OSError, 'bad'):
+                    for i in range(100):
+                        zipf.writestr(f'g{i}', b'g')
+                zipf.writestr('f5', b'5')
+        with zipfile.ZipFile(TESTFN2) as zipf:
+            self.assertIsNone(zipf.testzip())
+            names = zipf.namelist()
+            self.assertEqual(names, ['f1', 'f3'] +
+                             [f'g{i}' for i in range(len(names) - 3)] +
+                             ['f5'])
+
 class StoredWriterTests(AbstractWriterTests, unittest.TestCase):
     compression = zipfile.ZIP_STORED
 
@@ -1581,6 +1656,75 @@ def test_extract_all_with_target_pathlike(self):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(pathlib.Path(extdir))
 
+    def test_extract_all_workers(self):
+        with zipfile.ZipFile(TESTFN2, "w", zipfile.ZIP_DEFLATED) as zipfp:
+            zipfp.mkdir("emptydir")
+            for i in range(20):
+                zipfp.writestr(f"d{i % 3}/f{i}", f"data {i}" * 1000)
+        self.addCleanup(unlink, TESTFN2)
+        with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+            with self.assertRaises(ValueError):
+                zipfp.extractall(workers=0)
+            for workers in (1, 4):
+                with self.subTest(workers=workers), temp_dir() as extdir:
+                    zipfp.extractall(extdir, workers=workers)
+                    self.assertTrue(
+                        os.path.isdir(os.path.join(extdir, "emptydir")))
+                    for i in range(20):
+                        self.check_file(os.path.join(extdir, f"d{i % 3}", f"f{i}"),
+                                        f"data {i}".encode() * 1000)
+            self.assertEqual(zipfp._fileRefCnt, 1)
+
+    def test_extract_all_workers_duplicate_names(self):
+        # The last member with a given name wins, as with a single thread.
+        with zipfile.ZipFile(TESTFN2, "w") as zipfp:
+            with self.assertWarns(UserWarning):
+                for data in (b"first", b"second", b"last"):
+                    zipfp.writestr("dup", data)
+                    zipfp.writestr("other", b"other")
+        self.addCleanup(unlink, TESTFN2)
+        with zipfile.ZipFile(TESTFN2, "r") as zipfp, temp_dir() as extdir:
+            zipfp.extractall(extdir, members=zipfp.infolist(), workers=4)
+            self.check_file(os.path.join(extdir, "dup"), b"last")
+            self.check_file(os.path.join(extdir, "other"), b"other")
+
+    def test_extract_all_workers_colliding_names(self):
+        # Names that a case-insensitive file system maps to the same file
+        # are extracted one after the other.
+        with zipfile.ZipFile(TESTFN2, "w") as zipfp:
+            for name in ("a", "A", "b"):
+                zipfp.writestr(name, name)
+        self.addCleanup(unlink, TESTFN2)
+        threads = []
+        extract_member = zipfile.ZipFile._extract_member
+        def record_thread(self, *args):
+            threads.append(threading.get_ident())
+            return extract_member(self, *args)
+        with zipfile.ZipFile(TESTFN2, "r") as zipfp, temp_dir() as extdir, \
+             mock.patch.object(zipfile.ZipFile, "_extract_member",
+                               record_thread):
+            zipfp.extractall(extdir, workers=4)
+        self.assertEqual(threads, [threading.get_ident()] * 3)
+
+    def test_extract_all_workers_error(self):
+        # The first failure stops the members that are not extracted yet.
+        with zipfile.ZipFile(TESTFN2, "w") as zipfp:
+            for i in range(20):
+                zipfp.writestr(f"f{i}", b"data")
+        self.addCleanup(unlink, TESTFN2)
+        extracted = []
+        def extract_member(self, member, targetpath, pwd):
+            if member.filename == "f0":
+                raise OSError("f0")
+            time.sleep(0.5)
+            extracted.append(member.filename)
+        with zipfile.ZipFile(TESTFN2, "r") as zipfp, temp_dir() as extdir, \
+             mock.patch.object(zipfile.ZipFile, "_extract_member",
+                               extract_member):
+            with self.assertRaisesRegex(OSError, "f0"):
+                zipfp.extractall(extdir, workers=2)
+        self.assertLess(len(extracted), 19)
+
     def check_file(self, filename, content):
         self.assertTrue(os.path.isfile(filename))
         with open(filename, 'rb') as f:
@@ -1912,6 +2056,66 @@ def test_non_existent_file_raises_OSError(self):
         # quickly.
         self.assertRaises(OSError, zipfile.ZipFile, TESTFN)
 
+    def test_read_cp437_names(self):
+        # Names without the UTF-8 flag are decoded with cp437, including
+        # the bytes that are not ASCII.
+        raw_names = [b'caf\x82', bytes(range(0x80, 0x100))]
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w') as zf:
+            zf.writestr('ascii', b'0')
+            for i, raw_name in enumerate(raw_names):
+                zf.writestr(f'{i}'.ljust(len(raw_name), '_'), b'%d' % i)
+        data = buf.getvalue()
+        for i, raw_name in enumerate(raw_names):
+            data = data.replace(f'{i}'.ljust(len(raw_name), '_').encode(),
+                                raw_name)
+        names = [raw_name.decode('cp437') for raw_name in raw_names]
+        self.assertEqual(names[0], 'caf\xe9')
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            self.assertEqual(zf.namelist(), ['ascii', *names])
+            for i, name in enumerate(names):
+                zinfo = zf.getinfo(name)
+                self.assertFalse(zinfo.flag_bits & zipfile._MASK_UTF_FILENAME)
+                self.assertEqual(zf.read(zinfo), b'%d' % i)
+
+    def test_read_zip64_extra_next_to_no_extra(self):
+        buf = io.BytesIO()
+        with mock.patch.object(zipfile, 'ZIP64_LIMIT', 4):
+            with zipfile.ZipFile(buf, 'w') as zf:
+                zf.writestr('small', b'abc')
+                zf.writestr('large', b'0123456789')
+        with zipfile.ZipFile(buf) as zf:
+            small, large = zf.infolist()
+            self.assertEqual(small.extra, b'')
+            self.assertEqual(large.extra[:2], b'\x01\x00')  # zip64 header id
+            self.assertEqual((small.file_size, large.file_size), (3, 10))
+            self.assertEqual(zf.read('small'), b'abc')
+            self.assertEqual(zf.read('large'), b'0123456789')
+
+    def test_truncated_central_directory(self):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w') as zf:
+            zf.writestr('first', b'1')
+            zinfo = zipfile.ZipInfo('second')
+            zinfo.comment = b'comment'
+            zf.writestr(zinfo, b'2')
+        data = buf.getvalue()
+        endrec = list(struct.unpack(zipfile.structEndArchive,
+                                    data[-zipfile.sizeEndCentDir:]))
+        start = endrec[zipfile._ECD_OFFSET]
+        centdir = data[start:start + endrec[zipfile._ECD_SIZE]]
+        second = centdir.index(zipfile.stringCentralDir, 1)
+        # Cut in the fixed part, in the name, and in the comment of the
+        # second entry, with an end record that matches the cut.
+        for cut in (second + 10, second + zipfile.sizeCentralDir + 3,
+                    len(centdir) - 1):
+            with self.subTest(cut=cut):
+                endrec[zipfile._ECD_SIZE] = cut
+                bad = (data[:start] + centdir[:cut] +
+                       struct.pack(zipfile.structEndArchive, *endrec))
+                with self.assertRaises(zipfile.BadZipFile):
+                    zipfile.ZipFile(io.BytesIO(bad))
+
     def test_empty_file_raises_BadZipFile(self):
         f = open(TESTFN, 'w', encoding='utf-8')
         f.close()
@@ -2976,9 +3180,9 @@ def test_create_command(self):
             f.write('test 2')
         files = [TESTFN, TESTFNDIR]
         namelist = [TESTFN, TESTFNDIR + '/', TESTFNDIR + '/file.txt']
-        for opt in '-c', '--create':
+        for opts in ['-c'], ['--create'], ['--workers', '2', '-c']:
             try:
-                out = self.zipfilecmd(opt, TESTFN2, *files)
+                out = self.zipfilecmd(*opts, TESTFN2, *files)
                 self.assertEqual(out, b'')
                 with zipfile.ZipFile(TESTFN2) as zf:
                     self.assertEqual(zf.namelist(), namelist)
@@ -2989,9 +3193,9 @@ def test_create_command(self):
 
     def test_extract_command(self):
         zip_name = findfile('zipdir.zip')
-        for opt in '-e', '--extract':
+        for opts in ['-e'], ['--extract'], ['--workers', '2', '-e']:
             with temp_dir() as extdir:
-                out = self.zipfilecmd(opt, zip_name, extdir)
+                out = self.zipfilecmd(*opts, zip_name, extdir)
                 self.assertEqual(out, b'')
                 with zipfile.ZipFile(zip_name) as zf:
                     for zi in zf.infolist():
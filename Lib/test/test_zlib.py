@@ -1,6 +1,7 @@
 import unittest
 from test import support
 from test.support import import_helper
+import array
 import binascii
 import copy
 import os
@@ -1041,6 +1042,41 @@ def testDecompressorChunksMaxsize(self):
         self.assertEqual(out, self.BIG_TEXT)
         self.assertEqual(zlibd.unused_data, b"")
 
+    def testDecompressInto(self):
+        zlibd = zlib._ZlibDecompressor()
+        buf = bytearray(100)
+        out = []
+
+        # Feed some input
+        len_ = len(self.BIG_DATA) - 64
+        n = zlibd.decompress_into(self.BIG_DATA[:len_], buf)
+        self.assertFalse(zlibd.needs_input)
+        self.assertEqual(n, len(buf))
+        out.append(buf[:n])
+
+        # Retrieve more data while providing more input
+        n = zlibd.decompress_into(self.BIG_DATA[len_:], memoryview(buf))
+        self.assertLessEqual(n, len(buf))
+        out.append(buf[:n])
+
+        # Retrieve remaining uncompressed data, into a buffer that is not a
+        # bytearray and has items larger than a byte
+        buf = array.array('I', bytes(100))
+        while not zlibd.eof:
+            n = zlibd.decompress_into(b'', buf)
+            self.assertLessEqual(n, 100)
+            out.append(buf.tobytes()[:n])
+
+        out = b"".join(out)
+        self.assertEqual(out, self.BIG_TEXT)
+        self.assertEqual(zlibd.unused_data, b"")
+        self.assertRaises(EOFError, zlibd.decompress_into, b"", buf)
+        zlibd = zlib._ZlibDecompressor()
+        self.assertRaises(TypeError, zlibd.decompress_into, self.BIG_DATA,
+                          b"read-only")
+        zlibd = zlib._ZlibDecompressor()
+        self.assertEqual(zlibd.decompress_into(self.BIG_DATA, bytearray()), 0)
+
     def test_decompressor_inputbuf_1(self):
         # Test reusing input buffer after moving existing
         # contents to beginning
@@ -3,6 +3,7 @@
 
 XXX references to utf-8 need further investigation.
 """
+import _compression
 import binascii
 import importlib.util
 import io
@@ -53,6 +54,11 @@ class LargeZipFile(Exception):
 ZIP_FILECOUNT_LIMIT = (1 << 16) - 1
 ZIP_MAX_COMMENT = (1 << 16) - 1
 
+# Members up to this size are compressed on a thread pool by ZipFile.write()
+# and writestr() when the ZipFile has several workers.  Larger members are
+# compressed on the calling thread to bound the memory used.
+_PARALLEL_MEMBER_SIZE = 4 * 1024 * 1024
+
 # constants for Zip file compression methods
 ZIP_STORED = 0
 ZIP_DEFLATED = 8
@@ -97,6 +103,7 @@ class LargeZipFile(Exception):
 structCentralDir = "<4s4B4HL2L5H2L"
 stringCentralDir = b"PK\001\002"
 sizeCentralDir = struct.calcsize(structCentralDir)
+_CENTRAL_DIR_STRUCT = struct.Struct(structCentralDir)
 
 # indexes of entries in the central directory structure
 _CD_SIGNATURE = 0
@@ -747,6 +754,24 @@ def _get_compressor(compress_type, compresslevel=None):
         return None
 
 
+def _compress_data(data, compress_type, compresslevel):
+    """Compress the data of a member in one go.
+
+    Return the compressed data, the CRC and the size of the data.
+    """
+    crc = crc32(data)
+    file_size = len(data)
+    compressor = _get_compressor(compress_type, compresslevel)
+    if compressor:
+        data = compressor.compress(data) + compressor.flush()
+    return data, crc, file_size
+
+
+def _compress_file(filename, compress_type, compresslevel):
+    with open(filename, "rb") as src:
+        return _compress_data(src.read(), compress_type, compresslevel)
+
+
 def _get_decompressor(compress_type):
     _check_compression(compress_type)
     if compress_type == ZIP_STORED:
@@ -1252,11 +1277,24 @@ def close(self):
 
 
 
+def _path_collision_key(path):
+    """Return a key which is equal for paths that may name the same file.
+
+    Case-insensitive file systems, as commonly used on Windows and macOS,
+    map names which only differ in case, or in the Unicode normalization
+    form on macOS, to the same file.
+    """
+    if not path.isascii():
+        import unicodedata
+        path = unicodedata.normalize('NFD', path)
+    return path.casefold()
+
+
 class ZipFile:
     """ Class with methods to open, read, write, close, list zip files.
 
     z = ZipFile(file, mode="r", compression=ZIP_STORED, allowZip64=True,
-                compresslevel=None)
+                compresslevel=None, *, workers=None)
 
     file: Either the path to the file, or a file-like object.
           If it is a path, the file will be opened and closed by ZipFile.
@@ -1272,6 +1310,9 @@ class ZipFile:
                    When using ZIP_STORED or ZIP_LZMA this keyword has no effect.
                    When using ZIP_DEFLATED integers 0 through 9 are accepted.
                    When using ZIP_BZIP2 integers 1 through 9 are accepted.
+    workers: None (default) or the number of threads used to compress the
+             members added by write() and writestr().  Each member is then
+             written to the archive by a later call, in the original order.
 
     """
 
@@ -1279,11 +1320,14 @@ class ZipFile:
     _windows_illegal_name_trans_table = None
 
     def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
-                 compresslevel=None, *, strict_timestamps=True, metadata_encoding=None):
+                 compresslevel=None, *, strict_timestamps=True, metadata_encoding=None,
+                 workers=None):
         """Open the ZIP file with mode read 'r', write 'w', exclusive create 'x',
         or append 'a'."""
         if mode not in ('r', 'w', 'x', 'a'):
             raise ValueError("ZipFile requires mode 'r', 'w', 'x', or 'a'")
+        if not _compression._check_workers(workers):
+            workers = 1
 
         _check_compression(compression)
 
@@ -1299,6 +1343,10 @@ def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
         self._comment = b''
         self._strict_timestamps = strict_timestamps
         self.metadata_encoding = metadata_encoding
+        self._workers = workers
+        self._executor = None
+        # (ZipInfo, future) of the members waiting to be written, in order.
+        self._pending = []
 
         # Check that we don't try to write with nonconforming codecs
         if self.metadata_encoding and mode != 'r':
@@ -1424,30 +1472,44 @@ def _RealGetContents(self):
             raise BadZipFile("Bad offset for central directory")
         fp.seek(self.start_dir, 0)
         data = fp.read(size_cd)
-        fp = io.BytesIO(data)
+        unpack_centdir = _CENTRAL_DIR_STRUCT.unpack_from
+        encoding = self.metadata_encoding or 'cp437'
+        # cp437 decodes bytes 0x00-0x7F to the same characters as ASCII,
+        # and ASCII has a much faster decoder.
+        ascii_compatible = encoding == 'cp437'
         total = 0
         while total < size_cd:
-            centdir = fp.read(sizeCentralDir)
-            if len(centdir) != sizeCentralDir:
+            if total + sizeCentralDir > len(data):
                 raise BadZipFile("Truncated central directory")
-            centdir = struct.unpack(structCentralDir, centdir)
+            centdir = unpack_centdir(data, total)
             if centdir[_CD_SIGNATURE] != stringCentralDir:
                 raise BadZipFile("Bad magic number for central directory")
             if self.debug > 2:
                 print(centdir)
-            filename = fp.read(centdir[_CD_FILENAME_LENGTH])
-            orig_filename_crc = crc32(filename)
+            pos = total + sizeCentralDir
+            if (pos + centdir[_CD_FILENAME_LENGTH] +
+                    centdir[_CD_EXTRA_FIELD_LENGTH] +
+                    centdir[_CD_COMMENT_LENGTH]) > len(data):
+                raise BadZipFile("Truncated central directory")
+            end = pos + centdir[_CD_FILENAME_LENGTH]
+            filename = data[pos:end]
             flags = centdir[_CD_FLAG_BITS]
             if flags & _MASK_UTF_FILENAME:
                 # UTF-8 file names extension
-                filename = filename.decode('utf-8')
+                filename_str = filename.decode('utf-8')
+            elif ascii_compatible and filename.isascii():
+                filename_str = filename.decode('ascii')
             else:
                 # Historical ZIP filename encoding
-                filename = filename.decode(self.metadata_encoding or 'cp437')
+                filename_str = filename.decode(encoding)
             # Create ZipInfo instance to store file information
-            x = ZipInfo(filename)
-            x.extra = fp.read(centdir[_CD_EXTRA_FIELD_LENGTH])
-            x.comment = fp.read(centdir[_CD_COMMENT_LENGTH])
+            x = ZipInfo(filename_str)
+            pos = end
+            end = pos + centdir[_CD_EXTRA_FIELD_LENGTH]
+            x.extra = data[pos:end]
+            pos = end
+            end = pos + centdir[_CD_COMMENT_LENGTH]
+            x.comment = data[pos:end]
             x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
             (x.create_version, x.create_system, x.extract_version, x.reserved,
              x.flag_bits, x.compress_type, t, d,
@@ -1460,15 +1522,14 @@ def _RealGetContents(self):
             x._raw_time = t
             x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
                             t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
-            x._decodeExtra(orig_filename_crc)
+            if x.extra:
+                x._decodeExtra(crc32(filename))
             x.header_offset = x.header_offset + concat
             self.filelist.append(x)
             self.NameToInfo[x.filename] = x
 
             # update total bytes read from central directory
-            total = (total + sizeCentralDir + centdir[_CD_FILENAME_LENGTH]
-                     + centdir[_CD_EXTRA_FIELD_LENGTH]
-                     + centdir[_CD_COMMENT_LENGTH])
+            total = end
 
             if self.debug > 2:
                 print("total", total)
@@ -1572,6 +1633,7 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
         if not self.fp:
             raise ValueError(
                 "Attempt to use ZIP archive that was already closed")
+        self._write_pending()
 
         # Make sure we have an info object
         if isinstance(name, ZipInfo):
@@ -1594,7 +1656,8 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
                     "Close the writing handle before trying to read.")
 
         # Open for reading:
-        self._fileRefCnt += 1
+        with self._lock:
+            self._fileRefCnt += 1
         zef_file = _SharedFile(self.fp, zinfo.header_offset,
                                self._fpclose, self._lock, lambda: self._writing)
         try:
@@ -1702,12 +1765,16 @@ def extract(self, member, path=None, pwd=None):
 
         return self._extract_member(member, path, pwd)
 
-    def extractall(self, path=None, members=None, pwd=None):
+    def extractall(self, path=None, members=None, pwd=None, *, workers=None):
         """Extract all members from the archive to the current working
            directory. `path' specifies a different directory to extract to.
            `members' is optional and must be a subset of the list returned
-           by namelist().
+           by namelist(). `workers' is the number of threads used to
+           extract files concurrently; by default they are extracted one
+           after the other.
         """
+        concurrently = _compression._check_workers(workers)
+
         if members is None:
             members = self.namelist()
 
@@ -1716,9 +1783,48 @@ def extractall(self, path=None, members=None, pwd=None):
         else:
             path = os.fspath(path)
 
+        if concurrently:
+            self._extract_members_concurrently(members, path, pwd, workers)
+            return
+
         for zipinfo in members:
             self._extract_member(zipinfo, path, pwd)
 
+    def _extract_members_concurrently(self, members, path, pwd, workers):
+        members = [member if isinstance(member, ZipInfo)
+                   else self.getinfo(member)
+                   for member in members]
+        targets = {_path_collision_key(self._target_path(member, path))
+                   for member in members}
+        if len(targets) != len(members):
+            # Several members may be extracted to the same file, the last one
+            # must win as in a sequential extraction.
+            for member in members:
+                self._extract_member(member, path, pwd)
+            return
+
+        # Create the directories first so that the threads only have to
+        # write files.
+        files = []
+        for member in members:
+            if member.is_dir():
+                self._extract_member(member, path, pwd)
+            else:
+                files.append(member)
+
+        from concurrent.futures import FIRST_EXCEPTION, wait
+        with _compression._thread_pool(workers) as executor:
+            futures = [executor.submit(self._extract_member, member, path, pwd)
+                       for member in files]
+            # Stop at the first failure, as a sequential extraction would.
+            # Members that are already being extracted are completed.
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+        for future in futures:
+            if not future.cancelled():
+                future.result()
+
     @classmethod
     def _sanitize_windows_name(cls, arcname, pathsep):
         """Replace bad characters and remove trailing dots from parts."""
@@ -1741,6 +1847,28 @@ def _extract_member(self, member, targetpath, pwd):
         if not isinstance(member, ZipInfo):
             member = self.getinfo(member)
 
+        targetpath = self._target_path(member, targetpath)
+
+        # Create all upper directories if necessary.
+        upperdirs = os.path.dirname(targetpath)
+        if upperdirs and not os.path.exists(upperdirs):
+            os.makedirs(upperdirs, exist_ok=True)
+
+        if member.is_dir():
+            if not os.path.isdir(targetpath):
+                os.mkdir(targetpath)
+            return targetpath
+
+        with self.open(member, pwd=pwd) as source, \
+             open(targetpath, "wb") as target:
+            shutil.copyfileobj(source, target)
+
+        return targetpath
+
+    def _target_path(self, member, targetpath):
+        """Return the path to which the ZipInfo object 'member' is
+           extracted under targetpath.
+        """
         # build the destination pathname, replacing
         # forward slashes to platform specific separators.
         arcname = member.filename.replace('/', os.path.sep)
@@ -1761,23 +1889,7 @@ def _extract_member(self, member, targetpath, pwd):
             raise ValueError("Empty filename.")
 
         targetpath = os.path.join(targetpath, arcname)
-        targetpath = os.path.normpath(targetpath)
-
-        # Create all upper directories if necessary.
-        upperdirs = os.path.dirname(targetpath)
-        if upperdirs and not os.path.exists(upperdirs):
-            os.makedirs(upperdirs)
-
-        if member.is_dir():
-            if not os.path.isdir(targetpath):
-                os.mkdir(targetpath)
-            return targetpath
-
-        with self.open(member, pwd=pwd) as source, \
-             open(targetpath, "wb") as target:
-            shutil.copyfileobj(source, target)
-
-        return targetpath
+        return os.path.normpath(targetpath)
 
     def _writecheck(self, zinfo):
         """Check for errors before writing a file to the archive."""
@@ -1820,7 +1932,10 @@ def write(self, filename, arcname=None,
         if zinfo.is_dir():
             zinfo.compress_size = 0
             zinfo.CRC = 0
-            self.mkdir(zinfo)
+            if self._workers > 1:
+                self._write_concurrently(zinfo, None)
+            else:
+                self.mkdir(zinfo)
         else:
             if compress_type is not None:
                 zinfo.compress_type = compress_type
@@ -1832,6 +1947,10 @@ def write(self, filename, arcname=None,
             else:
                 zinfo._compresslevel = self.compresslevel
 
+            if self._workers > 1 and zinfo.file_size <= _PARALLEL_MEMBER_SIZE:
+                self._write_concurrently(zinfo, _compress_file, filename)
+                return
+
             with open(filename, "rb") as src, self.open(zinfo, 'w') as dest:
                 shutil.copyfileobj(src, dest, 1024*8)
 
@@ -1872,10 +1991,77 @@ def writestr(self, zinfo_or_arcname, data,
             zinfo._compresslevel = compresslevel
 
         zinfo.file_size = len(data)            # Uncompressed size
+        if self._workers > 1 and zinfo.file_size <= _PARALLEL_MEMBER_SIZE:
+            # Copy the data in case it is mutable.
+            self._write_concurrently(zinfo, _compress_data, bytes(data))
+            return
         with self._lock:
             with self.open(zinfo, mode='w') as dest:
                 dest.write(data)
 
+    def _write_concurrently(self, zinfo, compress, source=None):
+        """Compress a member on the thread pool and write it later.
+
+        The member is compressed by compress(source, compress_type,
+        compresslevel), or has no data if compress is None.  Members are
+        written in order, and at most twice as many as there are workers
+        are held in memory.
+        """
+        if self.mode not in ('w', 'x', 'a'):
+            raise ValueError("write() requires mode 'w', 'x', or 'a'")
+        if compress is None:
+            future = None
+        else:
+            if self._executor is None:
+                self._executor = _compression._thread_pool(self._workers)
+            future = self._executor.submit(compress, source,
+                                           zinfo.compress_type,
+                                           zinfo._compresslevel)
+        self._pending.append((zinfo, future))
+        self._didModify = True
+        self._write_pending(2 * self._workers)
+
+    def _write_pending(self, max_pending=0):
+        """Write compressed members to the archive, in order, until at
+        most max_pending are left.
+
+        If a member failed to compress, it is left out of the archive and
+        the exception is raised.
+        """
+        while len(self._pending) > max_pending:
+            zinfo, future = self._pending.pop(0)
+            if future is None:
+                data = b''
+                zinfo.CRC = 0
+            else:
+                data, zinfo.CRC, zinfo.file_size = future.result()
+            zinfo.compress_size = len(data)
+
+            zinfo.flag_bits = 0x00
+            if zinfo.compress_type == ZIP_LZMA:
+                # Compressed data includes an end-of-stream (EOS) marker
+                zinfo.flag_bits |= _MASK_COMPRESS_OPTION_1
+            if not zinfo.external_attr:
+                zinfo.external_attr = 0o600 << 16  # permissions: ?rw-------
+
+            # The sizes are known, so the header does not need to be
+            # rewritten and no data descriptor is needed.
+            zip64 = (zinfo.file_size > ZIP64_LIMIT or
+                     zinfo.compress_size > ZIP64_LIMIT)
+            if not self._allowZip64 and zip64:
+                raise LargeZipFile("Filesize would require ZIP64 extensions")
+
+            with self._lock:
+                if self._seekable:
+                    self.fp.seek(self.start_dir)
+                zinfo.header_offset = self.fp.tell()
+                self._writecheck(zinfo)
+                self.fp.write(zinfo.FileHeader(zip64))
+                self.fp.write(data)
+                self.start_dir = self.fp.tell()
+                self.filelist.append(zinfo)
+                self.NameToInfo[zinfo.filename] = zinfo
+
     def mkdir(self, zinfo_or_directory_name, mode=511):
         """Creates a directory inside the zip archive."""
         if isinstance(zinfo_or_directory_name, ZipInfo):
@@ -1895,6 +2081,7 @@ def mkdir(self, zinfo_or_directory_name, mode=511):
         else:
             raise TypeError("Expected type str or ZipInfo")
 
+        self._write_pending()
         with self._lock:
             if self._seekable:
                 self.fp.seek(self.start_dir)
@@ -1926,16 +2113,30 @@ def close(self):
                              "an open writing handle on it. "
                              "Close the writing handle before closing the zip.")
 
+        error = None
         try:
+            while self._pending:
+                try:
+                    self._write_pending()
+                except Exception as exc:
+                    # Keep the other members in the archive and report the
+                    # first failure once it is closed.
+                    if error is None:
+                        error = exc
             if self.mode in ('w', 'x', 'a') and self._didModify: # write ending records
                 with self._lock:
                     if self._seekable:
                         self.fp.seek(self.start_dir)
                     self._write_end_record()
         finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
             fp = self.fp
             self.fp = None
             self._fpclose(fp)
+        if error is not None:
+            raise error
 
     def _write_end_record(self):
         for zinfo in self.filelist:         # write central directory
@@ -2032,10 +2233,11 @@ def _write_end_record(self):
         self.fp.flush()
 
     def _fpclose(self, fp):
-        assert self._fileRefCnt > 0
-        self._fileRefCnt -= 1
-        if not self._fileRefCnt and not self._filePassed:
-            fp.close()
+        with self._lock:
+            assert self._fileRefCnt > 0
+            self._fileRefCnt -= 1
+            if not self._fileRefCnt and not self._filePassed:
+                fp.close()
 
 
 class PyZipFile(ZipFile):
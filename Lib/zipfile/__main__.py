@@ -21,6 +21,9 @@ def main(args=None):
                        help='Test if a zipfile is valid')
     parser.add_argument('--metadata-encoding', metavar='<encoding>',
                         help='Specify encoding of member names for -l, -e and -t')
+    parser.add_argument('--workers', type=int, metavar='<n>',
+                        help='Use <n> threads to compress or extract files '
+                             'for -c and -e')
     args = parser.parse_args(args)
 
     encoding = args.metadata_encoding
@@ -41,7 +44,7 @@ def main(args=None):
     elif args.extract is not None:
         src, curdir = args.extract
         with ZipFile(src, 'r', metadata_encoding=encoding) as zf:
-            zf.extractall(curdir)
+            zf.extractall(curdir, workers=args.workers)
 
     elif args.create is not None:
         if encoding:
@@ -63,7 +66,7 @@ def addToZip(zf, path, zippath):
                              os.path.join(path, nm), os.path.join(zippath, nm))
             # else: ignore
 
-        with ZipFile(zip_name, 'w') as zf:
+        with ZipFile(zip_name, 'w', workers=args.workers) as zf:
             for path in files:
                 zippath = os.path.basename(path)
                 if not zippath:
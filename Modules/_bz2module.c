@@ -481,8 +481,51 @@ decompress_buf(BZ2Decompressor *d, Py_ssize_t max_length)
 }
 
 
+/* Like decompress_buf(), but decompress into the caller's buffer of length
+   out_len instead of allocating one.  Return the number of bytes written, or
+   -1 on error. */
+static Py_ssize_t
+decompress_buf_into(BZ2Decompressor *d, char *out, Py_ssize_t out_len)
+{
+    bz_stream *bzs = &d->bzs;
+    Py_ssize_t remaining = out_len;
+
+    bzs->next_out = out;
+    while (remaining > 0) {
+        int bzret;
+        /* avail_out is only 32 bit as well. */
+        bzs->avail_out = (unsigned int)Py_MIN(remaining, UINT_MAX);
+        remaining -= bzs->avail_out;
+        bzs->avail_in = (unsigned int)Py_MIN(d->bzs_avail_in_real, UINT_MAX);
+        d->bzs_avail_in_real -= bzs->avail_in;
+
+        Py_BEGIN_ALLOW_THREADS
+        bzret = BZ2_bzDecompress(bzs);
+        Py_END_ALLOW_THREADS
+
+        d->bzs_avail_in_real += bzs->avail_in;
+        remaining += bzs->avail_out;
+
+        if (catch_bz2_error(bzret))
+            return -1;
+        if (bzret == BZ_STREAM_END) {
+            d->eof = 1;
+            break;
+        } else if (d->bzs_avail_in_real == 0) {
+            break;
+        }
+    }
+    return out_len - remaining;
+}
+
+
+/* Decompress data, keeping unconsumed input for the next call.  If out is
+   NULL, return the decompressed data as bytes (at most max_length of it).
+   Otherwise decompress into out, whose length must be passed as max_length,
+   and return the number of bytes written. */
 static PyObject *
-decompress(BZ2Decompressor *d, char *data, size_t len, Py_ssize_t max_length)
+decompress(BZ2Decompressor *d, char *data, size_t len, Py_ssize_t max_length,
+           Py_buffer *out)
 {
     char input_buffer_in_use;
     PyObject *result;
@@ -533,7 +576,13 @@ decompress(BZ2Decompressor *d, char *data, size_t len, Py_ssize_t max_length)
         input_buffer_in_use = 0;
     }
 
-    result = decompress_buf(d, max_length);
+    if (out == NULL) {
+        result = decompress_buf(d, max_length);
+    }
+    else {
+        Py_ssize_t written = decompress_buf_into(d, out->buf, out->len);
+        result = written < 0 ? NULL : PyLong_FromSsize_t(written);
+    }
     if(result == NULL) {
         bzs->next_in = NULL;
         return NULL;
@@ -624,7 +673,36 @@ _bz2_BZ2Decompressor_decompress_impl(BZ2Decompressor *self, Py_buffer *data,
     if (self->eof)
         PyErr_SetString(PyExc_EOFError, "End of stream already reached");
     else
-        result = decompress(self, data->buf, data->len, max_length);
+        result = decompress(self, data->buf, data->len, max_length, NULL);
+    RELEASE_LOCK(self);
+    return result;
+}
+
+/*[clinic input]
+_bz2.BZ2Decompressor.decompress_into
+
+    data: Py_buffer
+    buffer: Py_buffer(accept={rwbuffer})
+
+Decompress *data* into *buffer*, returning the number of bytes written.
+
+This is like decompress() with *max_length* set to the size of *buffer*,
+except that the uncompressed data is written into *buffer* rather than
+returned as a new bytes object.
+[clinic start generated code]*/
+
+static PyObject *
+_bz2_BZ2Decompressor_decompress_into_impl(BZ2Decompressor *self,
+                                          Py_buffer *data, Py_buffer *buffer)
+/*[clinic end generated code: output=abf7d2b084a93359 input=395ae6fa33c0e4ab]*/
+{
+    PyObject *result = NULL;
+
+    ACQUIRE_LOCK(self);
+    if (self->eof)
+        PyErr_SetString(PyExc_EOFError, "End of stream already reached");
+    else
+        result = decompress(self, data->buf, data->len, buffer->len, buffer);
     RELEASE_LOCK(self);
     return result;
 }
@@ -703,6 +781,7 @@ BZ2Decompressor_traverse(BZ2Decompressor *self, visitproc visit, void *arg)
 
 static PyMethodDef BZ2Decompressor_methods[] = {
     _BZ2_BZ2DECOMPRESSOR_DECOMPRESS_METHODDEF
+    _BZ2_BZ2DECOMPRESSOR_DECOMPRESS_INTO_METHODDEF
     {NULL}
 };
 
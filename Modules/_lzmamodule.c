@@ -993,8 +993,51 @@ decompress_buf(Decompressor *d, Py_ssize_t max_length)
     return NULL;
 }
 
+/* Like decompress_buf(), but decompress into the caller's buffer of length
+   out_len instead of allocating one.  Return the number of bytes written, or
+   -1 on error. */
+static Py_ssize_t
+decompress_buf_into(Decompressor *d, uint8_t *out, Py_ssize_t out_len)
+{
+    lzma_stream *lzs = &d->lzs;
+    _lzma_state *state = PyType_GetModuleState(Py_TYPE(d));
+    assert(state != NULL);
+
+    lzs->next_out = out;
+    lzs->avail_out = (size_t)out_len;
+    while (lzs->avail_out > 0) {
+        lzma_ret lzret;
+
+        Py_BEGIN_ALLOW_THREADS
+        lzret = lzma_code(lzs, LZMA_RUN);
+        Py_END_ALLOW_THREADS
+
+        if (lzret == LZMA_BUF_ERROR && lzs->avail_in == 0 && lzs->avail_out > 0) {
+            lzret = LZMA_OK; /* That wasn't a real error */
+        }
+        if (catch_lzma_error(state, lzret)) {
+            return -1;
+        }
+        if (lzret == LZMA_GET_CHECK || lzret == LZMA_NO_CHECK) {
+            d->check = lzma_get_check(&d->lzs);
+        }
+        if (lzret == LZMA_STREAM_END) {
+            d->eof = 1;
+            break;
+        } else if (lzs->avail_in == 0) {
+            break;
+        }
+    }
+    return out_len - (Py_ssize_t)lzs->avail_out;
+}
+
+/* Decompress data, keeping unconsumed input for the next call.  If out is
+   NULL, return the decompressed data as bytes (at most max_length of it).
+   Otherwise decompress into out, whose length must be passed as max_length,
+   and return the number of bytes written. */
 static PyObject *
-decompress(Decompressor *d, uint8_t *data, size_t len, Py_ssize_t max_length)
+decompress(Decompressor *d, uint8_t *data, size_t len, Py_ssize_t max_length,
+           Py_buffer *out)
 {
     char input_buffer_in_use;
     PyObject *result;
@@ -1045,7 +1088,13 @@ decompress(Decompressor *d, uint8_t *data, size_t len, Py_ssize_t max_length)
         input_buffer_in_use = 0;
     }
 
-    result = decompress_buf(d, max_length);
+    if (out == NULL) {
+        result = decompress_buf(d, max_length);
+    }
+    else {
+        Py_ssize_t written = decompress_buf_into(d, out->buf, out->len);
+        result = written < 0 ? NULL : PyLong_FromSsize_t(written);
+    }
     if (result == NULL) {
         lzs->next_in = NULL;
         return NULL;
@@ -1149,7 +1198,37 @@ _lzma_LZMADecompressor_decompress_impl(Decompressor *self, Py_buffer *data,
     if (self->eof)
         PyErr_SetString(PyExc_EOFError, "Already at end of stream");
     else
-        result = decompress(self, data->buf, data->len, max_length);
+        result = decompress(self, data->buf, data->len, max_length, NULL);
+    RELEASE_LOCK(self);
+    return result;
+}
+
+/*[clinic input]
+_lzma.LZMADecompressor.decompress_into
+
+    data: Py_buffer
+    buffer: Py_buffer(accept={rwbuffer})
+
+Decompress *data* into *buffer*, returning the number of bytes written.
+
+This is like decompress() with *max_length* set to the size of *buffer*,
+except that the uncompressed data is written into *buffer* rather than
+returned as a new bytes object.
+[clinic start generated code]*/
+
+static PyObject *
+_lzma_LZMADecompressor_decompress_into_impl(Decompressor *self,
+                                            Py_buffer *data,
+                                            Py_buffer *buffer)
+/*[clinic end generated code: output=05f944c4776c4f65 input=d81f52aac1f45966]*/
+{
+    PyObject *result = NULL;
+
+    ACQUIRE_LOCK(self);
+    if (self->eof)
+        PyErr_SetString(PyExc_EOFError, "Already at end of stream");
+    else
+        result = decompress(self, data->buf, data->len, buffer->len, buffer);
     RELEASE_LOCK(self);
     return result;
 }
@@ -1328,6 +1407,7 @@ Decompressor_traverse(Decompressor *self, visitproc visit, void *arg)
 
 static PyMethodDef Decompressor_methods[] = {
     _LZMA_LZMADECOMPRESSOR_DECOMPRESS_METHODDEF
+    _LZMA_LZMADECOMPRESSOR_DECOMPRESS_INTO_METHODDEF
     {NULL}
 };
 
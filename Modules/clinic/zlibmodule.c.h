@@ -995,6 +995,92 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(zlib_ZlibDecompressor_decompress_into__doc__,
+"decompress_into($self, /, data, buffer)\n"
+"--\n"
+"\n"
+"Decompress *data* into *buffer*, returning the number of bytes written.\n"
+"\n"
+"This is like decompress() with *max_length* set to the size of *buffer*,\n"
+"except that the uncompressed data is written into *buffer* rather than\n"
+"returned as a new bytes object.");
+
+#define ZLIB_ZLIBDECOMPRESSOR_DECOMPRESS_INTO_METHODDEF    \
+    {"decompress_into", _PyCFunction_CAST(zlib_ZlibDecompressor_decompress_into), METH_FASTCALL|METH_KEYWORDS, zlib_ZlibDecompressor_decompress_into__doc__},
+
+static PyObject *
+zlib_ZlibDecompressor_decompress_into_impl(ZlibDecompressor *self,
+                                           Py_buffer *data,
+                                           Py_buffer *buffer);
+
+static PyObject *
+zlib_ZlibDecompressor_decompress_into(ZlibDecompressor *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 2
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(data), &_Py_ID(buffer), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"data", "buffer", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "decompress_into",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[2];
+    Py_buffer data = {NULL, NULL};
+    Py_buffer buffer = {NULL, NULL};
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 2, 2, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[0], &data, PyBUF_SIMPLE) != 0) {
+        goto exit;
+    }
+    if (!PyBuffer_IsContiguous(&data, 'C')) {
+        _PyArg_BadArgument("decompress_into", "argument 'data'", "contiguous buffer", args[0]);
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[1], &buffer, PyBUF_WRITABLE) < 0) {
+        PyErr_Clear();
+        _PyArg_BadArgument("decompress_into", "argument 'buffer'", "read-write bytes-like object", args[1]);
+        goto exit;
+    }
+    if (!PyBuffer_IsContiguous(&buffer, 'C')) {
+        _PyArg_BadArgument("decompress_into", "argument 'buffer'", "contiguous buffer", args[1]);
+        goto exit;
+    }
+    return_value = zlib_ZlibDecompressor_decompress_into_impl(self, &data, &buffer);
+
+exit:
+    /* Cleanup for data */
+    if (data.obj) {
+       PyBuffer_Release(&data);
+    }
+    /* Cleanup for buffer */
+    if (buffer.obj) {
+       PyBuffer_Release(&buffer);
+    }
+
+    return return_value;
+}
+
 PyDoc_STRVAR(zlib_adler32__doc__,
 "adler32($module, data, value=1, /)\n"
 "--\n"
@@ -1129,4 +1215,4 @@ exit:
 #ifndef ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
     #define ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
 #endif /* !defined(ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF) */
-/*[clinic end generated code: output=57ff7b511ab23132 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=67d97e8e9c8efa9e input=a9049054013a1b77]*/
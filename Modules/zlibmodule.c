@@ -1537,9 +1537,59 @@ decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
 }
 
 
+/* Like decompress_buf(), but decompress into the caller's buffer of length
+   out_len instead of allocating one.  Return the number of bytes written, or
+   -1 on error. */
+static Py_ssize_t
+decompress_buf_into(ZlibDecompressor *self, uint8_t *out, Py_ssize_t out_len)
+{
+    Py_ssize_t remaining = out_len;
+    zlibstate *state = PyType_GetModuleState(Py_TYPE(self));
+
+    int err = Z_OK;
+
+    self->zst.next_out = out;
+    do {
+        arrange_input_buffer(&(self->zst), &(self->avail_in_real));
+
+        do {
+            self->zst.avail_out = (uint32_t)Py_MIN((size_t)remaining,
+                                                   UINT32_MAX);
+            remaining -= self->zst.avail_out;
+            Py_BEGIN_ALLOW_THREADS
+            err = inflate(&self->zst, Z_SYNC_FLUSH);
+            Py_END_ALLOW_THREADS
+            remaining += self->zst.avail_out;
+        } while (self->zst.avail_out == 0 && remaining > 0 &&
+                 (err == Z_OK || err == Z_BUF_ERROR));
+    } while (err != Z_STREAM_END && self->avail_in_real != 0 && remaining > 0 &&
+             (err == Z_OK || err == Z_BUF_ERROR));
+
+    if (err == Z_STREAM_END) {
+        self->eof = 1;
+        self->is_initialised = 0;
+        err = inflateEnd(&self->zst);
+        if (err != Z_OK) {
+            zlib_error(state, self->zst, err, "while finishing decompression");
+            return -1;
+        }
+    } else if (err != Z_OK && err != Z_BUF_ERROR) {
+        zlib_error(state, self->zst, err, "while decompressing data");
+        return -1;
+    }
+
+    self->avail_in_real += self->zst.avail_in;
+    return out_len - remaining;
+}
+
+
+/* Decompress data, keeping unconsumed input for the next call.  If out is
+   NULL, return the decompressed data as bytes (at most max_length of it).
+   Otherwise decompress into out, whose length must be passed as max_length,
+   and return the number of bytes written. */
 static PyObject *
 decompress(ZlibDecompressor *self, uint8_t *data,
-           size_t len, Py_ssize_t max_length)
+           size_t len, Py_ssize_t max_length, Py_buffer *out)
 {
     bool input_buffer_in_use;
     PyObject *result;
@@ -1589,7 +1639,13 @@ decompress(ZlibDecompressor *self, uint8_t *data,
         input_buffer_in_use = 0;
     }
 
-    result = decompress_buf(self, max_length);
+    if (out == NULL) {
+        result = decompress_buf(self, max_length);
+    }
+    else {
+        Py_ssize_t written = decompress_buf_into(self, out->buf, out->len);
+        result = written < 0 ? NULL : PyLong_FromSsize_t(written);
+    }
     if(result == NULL) {
         self->zst.next_in = NULL;
         return NULL;
@@ -1684,7 +1740,39 @@ zlib_ZlibDecompressor_decompress_impl(ZlibDecompressor *self,
         PyErr_SetString(PyExc_EOFError, "End of stream already reached");
     }
     else {
-        result = decompress(self, data->buf, data->len, max_length);
+        result = decompress(self, data->buf, data->len, max_length, NULL);
+    }
+    LEAVE_ZLIB(self);
+    return result;
+}
+
+/*[clinic input]
+zlib.ZlibDecompressor.decompress_into
+
+    data: Py_buffer
+    buffer: Py_buffer(accept={rwbuffer})
+
+Decompress *data* into *buffer*, returning the number of bytes written.
+
+This is like decompress() with *max_length* set to the size of *buffer*,
+except that the uncompressed data is written into *buffer* rather than
+returned as a new bytes object.
+[clinic start generated code]*/
+
+static PyObject *
+zlib_ZlibDecompressor_decompress_into_impl(ZlibDecompressor *self,
+                                           Py_buffer *data,
+                                           Py_buffer *buffer)
+/*[clinic end generated code: output=db0b4d804d986592 input=9a58fe7cf01c2715]*/
+{
+    PyObject *result = NULL;
+
+    ENTER_ZLIB(self);
+    if (self->eof) {
+        PyErr_SetString(PyExc_EOFError, "End of stream already reached");
+    }
+    else {
+        result = decompress(self, data->buf, data->len, buffer->len, buffer);
     }
     LEAVE_ZLIB(self);
     return result;
@@ -1798,6 +1886,7 @@ static PyMethodDef Decomp_methods[] =
 
 static PyMethodDef ZlibDecompressor_methods[] = {
     ZLIB_ZLIBDECOMPRESSOR_DECOMPRESS_METHODDEF
+    ZLIB_ZLIBDECOMPRESSOR_DECOMPRESS_INTO_METHODDEF
     {NULL}
 };
 
@@ -0,0 +1,150 @@
+"""Benchmark reading from gzip, bz2 and lzma files.
+
+Measures the decompressed throughput of the usual ways of consuming a
+compressed file: read() loops, readinto() loops into a preallocated buffer,
+and shutil.copyfileobj().  The compressed data is held in memory so that the
+results reflect the decompression layers rather than the disk.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import shutil
+import sys
+import time
+from optparse import OptionParser
+
+out = sys.stdout
+
+FORMATS = {
+    'gzip': gzip,
+    'bz2': bz2,
+    'lzma': lzma,
+}
+
+
+def make_data(size):
+    # Log-like text: compresses well, like the data these modules usually see.
+    lines = []
+    total = 0
+    i = 0
+    while total < size:
+        line = (f"2024-01-01 00:00:{i % 60:02d} INFO worker-{i % 17} "
+                f"processed request {i} in {i * 7 % 1000} ms\n").encode()
+        lines.append(line)
+        total += len(line)
+        i += 1
+    return b"".join(lines)[:size]
+
+
+class NullWriter(io.RawIOBase):
+    def writable(self):
+        return True
+
+    def write(self, b):
+        return len(b)
+
+
+# Here begin the tests
+
+def read_small_chunks(f):
+    """ read 4096 bytes at a time """
+    while f.read(4096):
+        pass
+
+
+def read_big_chunks(f):
+    """ read 128 KiB at a time """
+    while f.read(128 * 1024):
+        pass
+
+
+def readinto_small_buffer(f, buf=bytearray(8192)):
+    """ readinto() an 8 KiB buffer """
+    while f.readinto(buf):
+        pass
+
+
+def readinto_big_buffer(f, buf=bytearray(128 * 1024)):
+    """ readinto() a 128 KiB buffer """
+    while f.readinto(buf):
+        pass
+
+
+def copyfileobj(f):
+    """ shutil.copyfileobj() """
+    shutil.copyfileobj(f, NullWriter())
+
+
+tests = [
+    read_small_chunks, read_big_chunks,
+    readinto_small_buffer, readinto_big_buffer,
+    copyfileobj,
+]
+
+
+def run_during(duration, func):
+    _t = time.time
+    n = 0
+    start = os.times()
+    start_timestamp = _t()
+    real_start = start[4] or start_timestamp
+    while True:
+        func()
+        n += 1
+        if _t() - start_timestamp > duration:
+            break
+    end = os.times()
+    real = (end[4] if start[4] else time.time()) - real_start
+    return n, real, sum(end[0:2]) - sum(start[0:2])
+
+
+def run_all_tests(formats, size, duration):
+    data = make_data(size)
+    for name in formats:
+        module = FORMATS[name]
+        compressed = module.compress(data)
+        out.write(f"{name}: {size / 1024 ** 2:.3g} MiB compressed "
+                  f"to {len(compressed) / 1024 ** 2:.3g} MiB\n")
+        for test_func in tests:
+            out.write(f"[{name.center(6)}] {test_func.__doc__.strip()}... "
+                      .ljust(52))
+            out.flush()
+
+            def run():
+                with module.open(io.BytesIO(compressed), "rb") as f:
+                    test_func(f)
+
+            n, real, cpu = run_during(duration, run)
+            bw = n * float(size) / 1024 ** 2 / real
+            bw = ("%4d MiB/s" if bw > 100 else "%.3g MiB/s") % bw
+            out.write(bw.rjust(12) + "\n")
+            if cpu < 0.90 * real:
+                out.write("   warning: test above used only "
+                          f"{cpu / real:%} CPU, "
+                          "result may be flawed!\n")
+
+
+def main():
+    usage = "usage: %prog [-h|--help] [options] [format ...]"
+    parser = OptionParser(usage=usage)
+    parser.add_option("-s", "--size",
+                      action="store", type="int", dest="size",
+                      default=10 * 1024 ** 2,
+                      help="size of the uncompressed data (default: 10 MiB)")
+    parser.add_option("-d", "--duration",
+                      action="store", type="float", dest="duration",
+                      default=2.0,
+                      help="duration of each test in seconds (default: 2)")
+    options, args = parser.parse_args()
+    for name in args:
+        if name not in FORMATS:
+            parser.error(f"unknown format: {name!r} "
+                         f"(one of: {', '.join(FORMATS)})")
+    run_all_tests(args or list(FORMATS), options.size, options.duration)
+
+
+if __name__ == "__main__":
+    main()